@@ -27,11 +27,11 @@ Security:
 
 from __future__ import annotations
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse, JSONResponse
-from pathlib import Path
+from fastapi.responses import FileResponse, JSONResponse, Response
+from urllib.parse import quote
 import sqlite3
 
-from .store import _resolve_paths
+from .store import _resolve_paths, _thread_connection, _blob_path_for_sha
 from .tokens import verify_token
 
 # Create router with prefix and tags for API documentation
@@ -39,33 +39,24 @@ router = APIRouter(prefix="/artifacts", tags=["artifacts"])
 
 def _db() -> sqlite3.Connection:
     """
-    Create a database connection using the configured paths.
+    Return this thread's database connection for the configured paths.
+    
+    FastAPI runs these sync endpoints in a worker thread pool, so each worker
+    opens (and applies PRAGMAs) only once; see store._thread_connection.
     
     Returns:
-        SQLite connection with foreign key constraints enabled
+        SQLite connection configured like the artifact store's (WAL, foreign keys, ...)
     """
-    paths = _resolve_paths()
-    conn = sqlite3.connect(paths["db_path"])
-    conn.execute("PRAGMA foreign_keys=ON;")
-    return conn
+    return _thread_connection(_resolve_paths()["db_path"])
 
-def _blob_path_for_sha(blob_dir: Path, sha256: str) -> Path:
+def _content_disposition(filename: str) -> str:
     """
-    Convert SHA-256 hash to blob storage path.
-    
-    Uses the same two-level directory structure as the storage system:
-    - First 2 characters: top-level directory
-    - Next 2 characters: second-level directory
-    - Full hash: filename
-    
-    Args:
-        blob_dir: Base directory for blob storage
-        sha256: SHA-256 hash of the file content
-    
-    Returns:
-        Path object pointing to the blob storage location
+    Build the attachment Content-Disposition header, the same way FileResponse does.
     """
-    return Path(blob_dir) / sha256[:2] / sha256[2:4] / sha256
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
 
 @router.get("/{artifact_id}")
 def download_artifact(artifact_id: str, token: str = Query(...)):
@@ -79,7 +70,7 @@ def download_artifact(artifact_id: str, token: str = Query(...)):
     1. Verify the token is valid and not expired
     2. Ensure the token matches the requested artifact ID
     3. Check that the artifact exists in the database
-    4. Verify the file exists on disk
+    4. Verify the file exists on disk (unless its content is stored inline)
     
     Args:
         artifact_id: The unique identifier for the artifact (e.g., "art_abc123")
@@ -100,16 +91,24 @@ def download_artifact(artifact_id: str, token: str = Query(...)):
     if data["artifact_id"] != artifact_id:
         raise HTTPException(status_code=403, detail="Token does not match artifact")
 
-    # 2) Look up sha + mime + filename in DB
+    # 2) Look up sha + mime + filename (+ inline content) in DB
     paths = _resolve_paths()
     with _db() as conn:
         row = conn.execute(
-            "SELECT sha256, mime, filename FROM artifacts WHERE id = ?",
+            "SELECT sha256, mime, filename, data FROM artifacts WHERE id = ?",
             (artifact_id,),
         ).fetchone()
         if not row:
             raise HTTPException(status_code=404, detail="Artifact not found")
-        sha, mime, filename = row
+        sha, mime, filename, inline_data = row
+
+    # Small artifacts are stored inline: serve them straight from the row
+    if inline_data is not None:
+        return Response(
+            content=bytes(inline_data),
+            media_type=mime or "application/octet-stream",
+            headers={"Content-Disposition": _content_disposition(filename or artifact_id)},
+        )
 
     # 3) Resolve blob on disk
     blob = _blob_path_for_sha(paths["blob_dir"], sha)
@@ -9,7 +9,8 @@ files created by agents and the permanent artifact storage.
 The ingestion process:
 1. Takes files from staging folder (/session/artifacts inside the container)
 2. Computes SHA-256 fingerprint for deduplication
-3. Stores files in content-addressed blobstore (blobstore/ab/cd/abcdef...)
+3. Stores files in content-addressed blobstore (blobstore/ab/abcdef...),
+   or inline in SQLite when they are small (<= INLINE_MAX_BYTES)
 4. Records metadata in SQLite database
 5. Creates links between artifacts and sessions/runs
 6. Cleans up original files from staging area
@@ -19,7 +20,8 @@ Key features:
 - Content deduplication (same file content = same storage)
 - Session tracking (which artifacts belong to which conversation)
 - Size limits (prevents huge files from consuming storage)
-- Atomic operations (all-or-nothing for each file)
+- Atomic batches (one transaction per call; staged files are only moved into
+  the blobstore once it has committed)
 - Cleanup (removes staging files after successful ingestion)
 
 Environment variables (optional):
@@ -30,18 +32,28 @@ Environment variables (optional):
 
 from __future__ import annotations
 import os
+import errno
+import shutil
 import sqlite3
 import hashlib
 import mimetypes
 import uuid
 from pathlib import Path
-from typing import Iterable, List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 from datetime import datetime, timezone
 
-from .store import _resolve_paths, _connect 
+from .store import _resolve_paths, _connect, _blob_path_for_sha
 from .tokens import create_download_url
 
 
+# Files up to this size are stored in the artifacts table (data column) instead of
+# the blobstore: no directory creation / file write per artifact, one row read back.
+INLINE_MAX_BYTES = 32 * 1024
+
+# Blob shard directories (blob_dir/aa) already created by this process
+_known_shards: set[Path] = set()
+
+
 # ---------- small helpers ----------
 
 def _now_iso() -> str:
@@ -66,59 +78,37 @@ def _gen_artifact_id() -> str:
     # short, unique, human-ish
     return "art_" + uuid.uuid4().hex[:24]
 
-def _file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+def _file_sha256(path: Path) -> str:
     """
     Compute SHA-256 hash of a file for content fingerprinting.
     
-    Reads the file in chunks to handle large files efficiently without
-    loading the entire file into memory at once.
+    Uses hashlib.file_digest, which streams the file through a reusable buffer
+    straight into OpenSSL's SHA-256 (SHA-NI accelerated where available),
+    without allocating a bytes object per chunk.
     
     Args:
         path: Path to the file to hash
-        chunk_size: Size of each chunk to read (default: 1MB)
     
     Returns:
         SHA-256 hash as hexadecimal string
     """
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-def _blob_path_for_sha(blob_dir: Path, sha256: str) -> Path:
-    """
-    Convert SHA-256 hash to blob storage path.
-    
-    Uses a two-level directory structure to avoid too many files in one directory:
-    - First 2 characters: top-level directory
-    - Next 2 characters: second-level directory
-    - Full hash: filename
-    
-    Example: sha256="abc123..." → "blobstore/ab/c1/abc123..."
-    
-    Args:
-        blob_dir: Base directory for blob storage
-        sha256: SHA-256 hash of the file content
-    
-    Returns:
-        Path object pointing to the blob storage location
-    """
-    # e.g., blobstore/ab/cd/abcdef...
-    a, b = sha256[:2], sha256[2:4]
-    return blob_dir / a / b / sha256
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
-def _ensure_parent(p: Path) -> None:
+def _ensure_shard_dir(blob_path: Path) -> None:
     """
-    Ensure the parent directory of a path exists.
+    Ensure the blob's shard directory (blob_dir/aa) exists.
     
-    Creates all necessary parent directories if they don't exist.
-    Equivalent to `mkdir -p` in Unix.
+    Remembers directories it has created, so later blobs landing in the same
+    shard skip the stat/mkdir syscalls.
     
     Args:
-        p: Path whose parent directory should exist
+        blob_path: Blob path whose shard directory should exist
     """
-    p.parent.mkdir(parents=True, exist_ok=True)
+    shard = blob_path.parent
+    if shard not in _known_shards:
+        shard.mkdir(parents=True, exist_ok=True)
+        _known_shards.add(shard)
 
 def _sniff_mime(path: Path) -> str:
     """
@@ -203,6 +193,12 @@ def ingest_files(
     # Normalize to Path objects and filter out non-files
     new_paths = [Path(p) for p in new_host_files if p and Path(p).is_file()]
 
+    link_rows: List[tuple] = []
+    ingested: List[Path] = []
+    # (staged file, blob path) pairs, moved only after the batch has committed
+    blob_moves: List[Tuple[Path, Path]] = []
+
+    # One transaction for the whole batch
     with _connect(db_path) as conn:
         for src in new_paths:
             size = src.stat().st_size
@@ -221,26 +217,26 @@ def ingest_files(
                 continue
 
             # Compute content hash for deduplication
-            sha = _file_sha256(src)
+            # (small files are read once and the bytes reused for inline storage)
+            if size <= INLINE_MAX_BYTES:
+                data = src.read_bytes()
+                sha = hashlib.sha256(data).hexdigest()
+            else:
+                data = None
+                sha = _file_sha256(src)
             mime = _sniff_mime(src)
             created_at = _now_iso()
 
-            # Determine blob storage path
+            # Determine blob storage path (only written for large files)
             blob_path = _blob_path_for_sha(blob_dir, sha)
-            _ensure_parent(blob_path)
 
             # INSERT or SELECT existing artifact id by sha (handles deduplication)
-            artifact_id = _upsert_artifact(conn, sha, size, mime, src.name, created_at, blob_path, src)
+            artifact_id = _upsert_artifact(
+                conn, sha, size, mime, src.name, created_at, blob_path, src, blob_moves, data
+            )
 
             # Link row ties the artifact to this session/run/tool_call
-            conn.execute(
-                """
-                INSERT INTO links (artifact_id, session_id, run_id, tool_call_id, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (artifact_id, session_id, run_id, tool_call_id, created_at),
-            )
-            conn.commit()
+            link_rows.append((artifact_id, session_id, run_id, tool_call_id, created_at))
 
             # Create artifact descriptor
             desc = {
@@ -258,11 +254,26 @@ def ingest_files(
                 # No PUBLIC_BASE_URL or SECRET set; descriptor remains without url
                 pass
 
-            # Remove the original from the session folder (keep containers lean)
-            _safe_delete(src)
-
+            ingested.append(src)
             descriptors.append(desc)
 
+        conn.executemany(
+            """
+            INSERT INTO links (artifact_id, session_id, run_id, tool_call_id, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            link_rows,
+        )
+    # Leaving the block commits the whole batch at once (one WAL sync, not one per file).
+    # If anything above raised, the rows are rolled back and no staged file was touched.
+
+    # Only now move large files into the blobstore and remove the originals from
+    # the session folder (keep containers lean); moved files are already gone
+    for src, blob_path in blob_moves:
+        _move_to_blob(src, blob_path)
+    for src in ingested:
+        _safe_delete(src)
+
     return descriptors
 
 
@@ -275,13 +286,15 @@ def _upsert_artifact(
     created_at: str,
     blob_path: Path,
     src_file: Path,
+    blob_moves: List[Tuple[Path, Path]],
+    data: Optional[bytes] = None,
 ) -> str:
     """
     Upsert (insert or update) an artifact in the database.
     
     This function handles the core deduplication logic:
     - If the SHA256 already exists, return the existing artifact ID
-    - If it's a new file, store it in blobstore and create a new database entry
+    - If it's a new file, store it (inline or in blobstore) and create a new database entry
     
     The "upsert" pattern ensures that identical file content is only stored once,
     even if it's created multiple times by different agents or sessions.
@@ -294,52 +307,78 @@ def _upsert_artifact(
         filename: Original filename
         created_at: ISO timestamp
         blob_path: Path where the file should be stored in blobstore
-        src_file: Source file path (for copying)
+        src_file: Source file path (moved into blobstore)
+        blob_moves: Collects (src_file, blob_path) when the blob must be written;
+                    the caller performs the move after committing
+        data: File content for small files; stored inline instead of in blobstore
     
     Returns:
         Artifact ID (either existing or newly created)
+    
+    Note: does not commit; the caller owns the transaction.
     """
     # Do we already know this sha?
-    cur = conn.execute("SELECT id FROM artifacts WHERE sha256 = ?", (sha256,))
+    cur = conn.execute("SELECT id, data IS NOT NULL FROM artifacts WHERE sha256 = ?", (sha256,))
     row = cur.fetchone()
     if row:
+        art_id, is_inline = row
         # ensure blob exists (in case it was pruned)
-        if not blob_path.exists():
-            _copy_bytes(src_file, blob_path)
-        return row[0]
+        if not is_inline and not blob_path.exists():
+            blob_moves.append((src_file, blob_path))
+        return art_id
 
-    # New artifact: write blob and insert row
-    _copy_bytes(src_file, blob_path)
+    # New artifact: queue the blob write (large files only) and insert row
+    if data is None:
+        blob_moves.append((src_file, blob_path))
     art_id = _gen_artifact_id()
     conn.execute(
         """
-        INSERT INTO artifacts (id, sha256, size, mime, filename, created_at)
-        VALUES (?, ?, ?, ?, ?, ?)
+        INSERT INTO artifacts (id, sha256, size, mime, filename, created_at, data)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
-        (art_id, sha256, size, mime, filename, created_at),
+        (art_id, sha256, size, mime, filename, created_at, data),
     )
-    conn.commit()
     return art_id
 
 
-def _copy_bytes(src: Path, dst: Path, chunk_size: int = 1024 * 1024) -> None:
+def _move_to_blob(src: Path, dst: Path) -> None:
     """
-    Copy file bytes from source to destination in chunks.
+    Move a staged file into its blobstore location.
     
-    This function efficiently copies large files without loading them entirely
-    into memory. It reads and writes in chunks to handle files of any size.
+    On the same filesystem this is a single atomic rename: no bytes are read or
+    written. Across filesystems it falls back to copying into a temp file next
+    to the blob and renaming that into place. If the blob already exists
+    (deduplicated content) nothing is moved; the caller deletes the source.
     
     Args:
-        src: Source file path
-        dst: Destination file path
-        chunk_size: Size of each chunk to read/write (default: 1MB)
+        src: Source file path (staging area)
+        dst: Destination blob path
     """
-    _ensure_parent(dst)
+    _ensure_shard_dir(dst)
     if dst.exists():
         return
-    with src.open("rb") as fsrc, dst.open("wb") as fdst:
-        for chunk in iter(lambda: fsrc.read(chunk_size), b""):
-            fdst.write(chunk)
+    try:
+        _rename_or_copy(src, dst)
+    except FileNotFoundError:
+        if not src.exists():
+            raise
+        # Shard directory removed behind our back (pruned?): forget it and recreate
+        _known_shards.discard(dst.parent)
+        _ensure_shard_dir(dst)
+        _rename_or_copy(src, dst)
+
+def _rename_or_copy(src: Path, dst: Path) -> None:
+    """
+    os.replace src onto dst, copying instead when they are on different filesystems.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        tmp = dst.with_name(dst.name + ".tmp")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
 
 def _safe_delete(path: Path) -> None:
     """
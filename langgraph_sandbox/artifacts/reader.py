@@ -25,42 +25,19 @@ Pipeline:
 from __future__ import annotations
 import os
 import sqlite3
-from pathlib import Path
 from typing import Optional, Dict, List
 
-from .store import _resolve_paths
+from .store import _resolve_paths, _thread_connection, _blob_path_for_sha
 
 def _db() -> sqlite3.Connection:
     """
-    Create a database connection using the configured paths.
+    Return this thread's database connection for the configured paths
+    (opened once per thread and path, see store._thread_connection).
     
     Returns:
-        SQLite connection with foreign key constraints enabled
+        SQLite connection configured like the artifact store's (WAL, foreign keys, ...)
     """
-    paths = _resolve_paths()
-    conn = sqlite3.connect(paths["db_path"])
-    conn.execute("PRAGMA foreign_keys=ON;")
-    return conn
-
-def _blob_path_for_sha(blob_dir: Path, sha256: str) -> Path:
-    """
-    Convert a SHA256 hash to the corresponding blob storage path.
-    
-    Uses a two-level directory structure to avoid too many files in one directory:
-    - First 2 characters: top-level directory
-    - Next 2 characters: second-level directory  
-    - Full hash: filename
-    
-    Example: sha256="abc123..." → "blobstore/ab/c1/abc123..."
-    
-    Args:
-        blob_dir: Base directory for blob storage
-        sha256: SHA256 hash of the file content
-    
-    Returns:
-        Path object pointing to the actual file location
-    """
-    return Path(blob_dir) / sha256[:2] / sha256[2:4] / sha256
+    return _thread_connection(_resolve_paths()["db_path"])
 
 def get_metadata(artifact_id: str) -> Dict:
     """
@@ -111,9 +88,9 @@ def read_bytes(artifact_id: str) -> bytes:
     
     This is the fundamental reading function that all other readers use.
     It:
-    1. Looks up the artifact metadata in the database
-    2. Converts the SHA256 hash to the actual file path
-    3. Reads and returns the raw file bytes
+    1. Looks up the artifact in the database
+    2. Returns the inline content directly for small artifacts
+    3. Otherwise converts the SHA256 hash to the blob path and reads the file
     
     Args:
         artifact_id: The unique identifier for the artifact
@@ -125,10 +102,20 @@ def read_bytes(artifact_id: str) -> bytes:
         FileNotFoundError: If the artifact ID doesn't exist or the file is missing
     """
     paths = _resolve_paths()
-    meta = get_metadata(artifact_id)
-    blob = _blob_path_for_sha(paths["blob_dir"], meta["sha256"])
+    with _db() as conn:
+        row = conn.execute(
+            "SELECT sha256, data FROM artifacts WHERE id = ?",
+            (artifact_id,),
+        ).fetchone()
+        if not row:
+            raise FileNotFoundError(f"Artifact not found: {artifact_id}")
+    sha, data = row
+    # Small artifacts are stored inline, no blob on disk
+    if data is not None:
+        return bytes(data)
+    blob = _blob_path_for_sha(paths["blob_dir"], sha)
     if not blob.exists():
-        raise FileNotFoundError(f"Blob missing for {artifact_id} (sha={meta['sha256']})")
+        raise FileNotFoundError(f"Blob missing for {artifact_id} (sha={sha})")
     return blob.read_bytes()
 
 def read_text(artifact_id: str, encoding: str = "utf-8", max_bytes: Optional[int] = None) -> str:
@@ -229,20 +216,16 @@ def fetch_artifact_urls(session_id: str) -> List[Dict[str, str]]:
         - download_url: Complete URL for downloading the artifact
     
     Note:
-        This function handles errors gracefully - if URL creation fails for
-        any artifact, it logs a warning but continues processing others.
+        This function handles errors gracefully - if the lookup or URL creation
+        fails, it logs the error and returns an empty list.
     """
-    from .tokens import create_download_url
-    import sqlite3
+    from .tokens import create_download_urls
     
     artifacts = []
     
     try:
-        # Use the artifact store's path resolution (respects environment variables)
-        paths = _resolve_paths()
-        db_path = paths["db_path"]
-        
-        with sqlite3.connect(db_path) as conn:
+        # Per-thread connection for the configured paths (respects environment variables)
+        with _db() as conn:
             # Get all artifacts linked to this session
             rows = conn.execute("""
                 SELECT a.id, a.filename, a.mime, a.size, a.created_at
@@ -251,21 +234,18 @@ def fetch_artifact_urls(session_id: str) -> List[Dict[str, str]]:
                 WHERE l.session_id = ?
                 ORDER BY a.created_at DESC
             """, (session_id,)).fetchall()
-            
-            for row in rows:
-                artifact_id, filename, mime, size, created_at = row
-                try:
-                    download_url = create_download_url(artifact_id)
-                    artifacts.append({
-                        "id": artifact_id,
-                        "filename": filename or artifact_id,
-                        "mime": mime,
-                        "size": size,
-                        "created_at": created_at,
-                        "download_url": download_url
-                    })
-                except Exception as e:
-                    print(f"Warning: Could not create URL for artifact {artifact_id}: {e}")
+        
+        # Sign all URLs in one pass (base URL and expiration resolved once)
+        urls = create_download_urls(row[0] for row in rows)
+        for (artifact_id, filename, mime, size, created_at), download_url in zip(rows, urls):
+            artifacts.append({
+                "id": artifact_id,
+                "filename": filename or artifact_id,
+                "mime": mime,
+                "size": size,
+                "created_at": created_at,
+                "download_url": download_url
+            })
                     
     except Exception as e:
         print(f"Error fetching artifacts: {e}")
@@ -0,0 +1,239 @@
+# langgraph_sandbox/artifacts/server.py
+"""
+Background Artifact Server
+
+Runs the artifact API (see api.py) with uvicorn next to an interactive session,
+either in a daemon thread (start_artifact_server) or as a task on the caller's
+event loop (serve_artifact_server). langgraph_sandbox/main.py and the usage
+examples all start their artifact server through here.
+
+Port selection:
+- The listening socket is bound in the calling thread, so a busy port is
+  detected up front (uvicorn.run() would sys.exit() inside the server thread)
+- The preferred port (default 8000) is tried first; if it is taken, the OS
+  picks a free one in a single bind
+- ARTIFACTS_SERVER_PORT is set to the chosen port so download URLs match
+
+Compression:
+- Text-like responses (CSV, JSON, ...) are gzipped for clients that accept it;
+  binary artifacts (parquet, png, zip) and Range requests pass through as-is
+"""
+
+from __future__ import annotations
+import asyncio
+import contextlib
+import os
+import socket
+import threading
+import time
+import zlib
+from typing import Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .api import router
+
+
+def _bind_socket(preferred_port: int) -> socket.socket:
+    """
+    Bind the server's listening socket, falling back to an OS-assigned port.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        sock.bind(("0.0.0.0", preferred_port))
+    except OSError:
+        print(f"⚠️  Port {preferred_port} is already in use (likely by Docker Compose), using a free port instead...")
+        sock.bind(("0.0.0.0", 0))
+    return sock
+
+
+_COMPRESSIBLE_TYPES = frozenset({
+    "application/json", "application/x-ndjson", "application/xml",
+    "application/javascript", "application/geo+json", "image/svg+xml",
+})
+
+
+def _is_compressible(content_type: str) -> bool:
+    """True for text-like media types, where gzip actually pays off."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+class _GZipTextMiddleware:
+    """
+    gzip text-like responses for clients that send Accept-Encoding: gzip.
+
+    Unlike Starlette's GZipMiddleware (whose content-type filtering depends on
+    the installed version), the decision is made on the response's media type:
+    already-compressed or binary artifacts are sent untouched, and Range
+    requests are never compressed so partial downloads keep working. Streamed
+    FileResponse bodies are compressed chunk by chunk. Compressed responses
+    drop Accept-Ranges and carry a weak ETag.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, compresslevel: int = 6) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        headers = Headers(scope=scope) if scope["type"] == "http" else None
+        if headers is None or "gzip" not in headers.get("accept-encoding", "") or "range" in headers:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                start = message  # held back until we have seen the first body chunk
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                response_headers = MutableHeaders(raw=start["headers"])
+                if (
+                    start["status"] == 200
+                    and "content-encoding" not in response_headers
+                    and _is_compressible(response_headers.get("content-type", ""))
+                    and (more_body or len(body) >= self.minimum_size)
+                ):
+                    compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+                    response_headers["Content-Encoding"] = "gzip"
+                    response_headers.add_vary_header("Accept-Encoding")
+                    del response_headers["Content-Length"]
+                    # Byte ranges and a strong ETag describe the identity body, not
+                    # the gzipped one: stop advertising ranges and weaken the ETag
+                    del response_headers["Accept-Ranges"]
+                    etag = response_headers.get("etag")
+                    if etag and not etag.startswith("W/"):
+                        response_headers["ETag"] = "W/" + etag
+                    if not more_body:
+                        # Whole body in one message: compress it now and keep a Content-Length
+                        body = compressor.compress(body) + compressor.flush()
+                        response_headers["Content-Length"] = str(len(body))
+                        message = {**message, "body": body}
+                        compressor = None
+                await send(start)
+                start = None
+
+            if compressor is not None:
+                flush_mode = zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+                message = {**message, "body": compressor.compress(body) + compressor.flush(flush_mode)}
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+
+class _EmbeddedServer(uvicorn.Server):
+    """uvicorn server that leaves SIGINT/SIGTERM handling to the host application."""
+
+    @contextlib.contextmanager
+    def capture_signals(self):
+        yield
+
+
+def _make_server(app: Optional[FastAPI], preferred_port: int) -> Tuple[uvicorn.Server, socket.socket, int]:
+    """
+    Build the uvicorn server and bind its socket. Returns (server, socket, port).
+    """
+    if app is None:
+        app = FastAPI()
+        app.include_router(router)
+
+    sock = _bind_socket(preferred_port)
+    port = sock.getsockname()[1]
+    # Set the server port in environment for URL generation
+    os.environ["ARTIFACTS_SERVER_PORT"] = str(port)
+
+    # loop/http stay "auto": uvloop and httptools are used when installed
+    server = _EmbeddedServer(uvicorn.Config(
+        _GZipTextMiddleware(app), log_level="error", access_log=False, server_header=False, date_header=False,
+    ))
+    return server, sock, port
+
+
+def start_artifact_server(app: Optional[FastAPI] = None, preferred_port: int = 8000) -> int:
+    """
+    Start the artifact server in a daemon thread.
+
+    Args:
+        app: FastAPI app to serve; a new one with the artifacts router is
+             created when omitted
+        preferred_port: Port to try first
+
+    Returns:
+        The port the server listens on
+    """
+    server, sock, port = _make_server(app, preferred_port)
+    server_thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    server_thread.start()
+    if not _wait_started(server, server_thread):
+        print("⚠️  Artifact server did not report startup in time; download links may not work yet")
+    return port
+
+
+async def serve_artifact_server(
+    app: Optional[FastAPI] = None, preferred_port: int = 8000, timeout: float = 5.0,
+) -> Tuple[uvicorn.Server, asyncio.Task, int]:
+    """
+    Start the artifact server as a task on the running event loop.
+
+    For async REPLs: requests are served by the same loop that streams the
+    graph, with no extra thread or second event loop. The loop must keep
+    running between turns (e.g. read user input off-loop) for downloads to
+    be served.
+
+    Args:
+        app: FastAPI app to serve; a new one with the artifacts router is
+             created when omitted
+        preferred_port: Port to try first
+        timeout: Seconds to wait for startup
+
+    Returns:
+        (server, task, port); to stop, set server.should_exit = True and await task
+    """
+    server, sock, port = _make_server(app, preferred_port)
+    task = asyncio.create_task(server.serve(sockets=[sock]))
+
+    deadline = time.monotonic() + timeout
+    while not server.started and not task.done() and time.monotonic() < deadline:
+        await asyncio.sleep(0.005)
+    if task.done():
+        task.result()  # surface startup errors
+    if not server.started:
+        print("⚠️  Artifact server did not report startup in time; download links may not work yet")
+    return server, task, port
+
+
+def _wait_started(server: uvicorn.Server, thread: threading.Thread, timeout: float = 5.0) -> bool:
+    """
+    Wait until uvicorn has finished startup (instead of a fixed sleep).
+
+    Polls Server.started with a short backoff, giving up early if the server
+    thread dies. Returns True once the server is accepting connections.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while time.monotonic() < deadline:
+        if server.started:
+            return True
+        if not thread.is_alive():
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 0.005)
+    return server.started
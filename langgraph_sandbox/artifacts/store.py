@@ -8,7 +8,8 @@ This module handles the initialization of the artifact storage system:
 - Sets up the database schema with proper indexes
 
 The storage system uses a content-addressed approach:
-- Files are stored by their SHA256 hash (e.g., blobstore/ab/cd/abcdef...)
+- Files are stored by their SHA256 hash (e.g., blobstore/ab/abcdef...)
+- Small files are stored inline in the database instead (artifacts.data)
 - Database tracks metadata and relationships between artifacts and sessions
 - This enables deduplication and efficient storage
 
@@ -18,12 +19,15 @@ Environment variables (optional):
 """
 
 from __future__ import annotations
+import functools
 import os
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 
+@functools.lru_cache(maxsize=1)
 def _project_root() -> Path:
     """
     Find the project root directory.
@@ -58,18 +62,84 @@ def _resolve_paths(custom_db_path: str | None = None, custom_blob_dir: str | Non
     
     # Priority: custom parameters > environment variables > defaults
     if custom_db_path:
-        db_path = Path(custom_db_path).resolve()
+        db_path = _resolved(custom_db_path)
     else:
-        db_path = Path(os.getenv("ARTIFACTS_DB_PATH", root / "artifacts.db")).resolve()
+        db_path = _resolved(os.getenv("ARTIFACTS_DB_PATH", str(root / "artifacts.db")))
     
     if custom_blob_dir:
-        blob_dir = Path(custom_blob_dir).resolve()
+        blob_dir = _resolved(custom_blob_dir)
     else:
-        blob_dir = Path(os.getenv("BLOBSTORE_DIR", root / "blobstore")).resolve()
+        blob_dir = _resolved(os.getenv("BLOBSTORE_DIR", str(root / "blobstore")))
     
     return {"db_path": db_path, "blob_dir": blob_dir}
 
 
+def _resolved(path: str) -> Path:
+    """
+    Path(path).resolve(), memoized for absolute paths.
+    
+    _resolve_paths() runs on every artifact request and tool call; the env vars
+    are still read each time (tests and callers change them), but the stat()
+    syscalls behind resolve() are only paid once per distinct path. Relative
+    paths depend on the working directory and are always resolved afresh.
+    """
+    if not os.path.isabs(path):
+        return Path(path).resolve()
+    return _resolved_abs(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _resolved_abs(path: str) -> Path:
+    return Path(path).resolve()
+
+
+def _blob_path_for_sha(blob_dir: Path, sha256: str) -> Path:
+    """
+    Convert a SHA-256 hash to its blob storage path.
+    
+    One level of 2-hex-character shard directories (256 buckets, like Git's
+    object store) keeps directories small while costing a single extra path
+    component per lookup.
+    
+    Example: sha256="abc123..." → "blobstore/ab/abc123..."
+    
+    Args:
+        blob_dir: Base directory for blob storage
+        sha256: SHA-256 hash of the file content
+    
+    Returns:
+        Path object pointing to the blob storage location
+    """
+    return Path(blob_dir) / sha256[:2] / sha256
+
+
+# PRAGMA user_version once the blobstore uses the aa/<sha> layout
+BLOB_LAYOUT_VERSION = 2
+
+
+def _migrate_blob_layout(blob_dir: Path) -> None:
+    """
+    Move blobs from the old two-level layout (aa/bb/<sha>) to aa/<sha>.
+    
+    Idempotent. ensure_artifact_store runs it only until the database records
+    BLOB_LAYOUT_VERSION. Entries are filtered by name before any stat, so
+    64-char blob names are skipped without touching the files themselves.
+    
+    Args:
+        blob_dir: Base directory for blob storage
+    """
+    for shard in blob_dir.iterdir():
+        if len(shard.name) != 2 or not shard.is_dir():
+            continue
+        for sub in shard.iterdir():
+            # Blob names are 64 chars: skip them without a stat
+            if len(sub.name) != 2 or not sub.is_dir():
+                continue
+            for blob in sub.iterdir():
+                os.replace(blob, shard / blob.name)
+            sub.rmdir()
+
+
 def _connect(db_path: Path) -> sqlite3.Connection:
     """
     Create a SQLite database connection with optimized settings.
@@ -78,6 +148,10 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     - WAL mode: Better concurrency (multiple readers, single writer)
     - NORMAL sync: Good balance between safety and performance
     - Foreign keys: Enforces referential integrity
+    - In-memory temp store and a 256 MiB mmap window: fewer read/write syscalls
+
+    Every module opening the artifact DB should go through here so all
+    connections share the same settings.
     
     Args:
         db_path: Path to the SQLite database file
@@ -90,6 +164,56 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     conn.execute("PRAGMA journal_mode=WAL;")      # Write-Ahead Logging for better concurrency
     conn.execute("PRAGMA synchronous=NORMAL;")    # Balanced safety/performance
     conn.execute("PRAGMA foreign_keys=ON;")       # Enforce foreign key constraints
+    conn.execute("PRAGMA temp_store=MEMORY;")     # Temp tables/indices in RAM
+    conn.execute("PRAGMA mmap_size=268435456;")   # Memory-map up to 256 MiB of the DB file
+    return conn
+
+
+# Per-thread connections, keyed by database path (see _thread_connection)
+_local = threading.local()
+
+
+def _file_id(db_path: Path) -> Optional[Tuple[int, int]]:
+    """(st_dev, st_ino) of the database file, or None if it does not exist."""
+    try:
+        st = os.stat(db_path)
+    except FileNotFoundError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _thread_connection(db_path: Path) -> sqlite3.Connection:
+    """
+    Return this thread's shared connection to db_path, opening it on first use.
+    
+    Read paths (the API endpoints, reader.py) run once per request or turn;
+    reusing the connection skips opening the file and applying the PRAGMAs
+    each time. Using it as a context manager only commits/rolls back, it does
+    not close it.
+    
+    The cached connection is only reused while db_path is still the file it
+    opened (same device/inode): if the database was deleted or replaced, it
+    is closed and a new one is opened. The open connection keeps its file
+    alive, so a recreated database never gets the same inode.
+    
+    Args:
+        db_path: Path to the SQLite database file
+    
+    Returns:
+        SQLite connection configured like _connect's
+    """
+    conns: Dict[Path, Tuple[sqlite3.Connection, Optional[Tuple[int, int]]]] = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    file_id = _file_id(db_path)
+    cached = conns.get(db_path)
+    if cached is not None:
+        conn, opened_id = cached
+        if opened_id == file_id and file_id is not None:
+            return conn
+        conn.close()  # stale handle: the database file was deleted or replaced
+    conn = _connect(db_path)
+    conns[db_path] = (conn, _file_id(db_path))
     return conn
 
 
@@ -99,6 +223,7 @@ def _create_schema(conn: sqlite3.Connection) -> None:
     
     Creates two main tables:
     1. 'artifacts': Stores file metadata (ID, SHA256, size, MIME type, etc.)
+       and, for small files, the content itself
     2. 'links': Tracks relationships between artifacts and sessions/runs
     
     The schema supports:
@@ -120,7 +245,8 @@ def _create_schema(conn: sqlite3.Connection) -> None:
             size INTEGER NOT NULL,                  -- File size in bytes
             mime TEXT NOT NULL,                     -- MIME type (image/png, text/csv, etc.)
             filename TEXT,                          -- Original filename
-            created_at TEXT NOT NULL                -- ISO timestamp of creation
+            created_at TEXT NOT NULL,               -- ISO timestamp of creation
+            data BLOB                               -- Inline content for small files (NULL = in blobstore)
         );
 
         -- Links table: tracks relationships between artifacts and sessions
@@ -136,9 +262,16 @@ def _create_schema(conn: sqlite3.Connection) -> None:
         -- Performance indexes for common queries
         CREATE INDEX IF NOT EXISTS idx_artifacts_sha256 ON artifacts(sha256);
         CREATE INDEX IF NOT EXISTS idx_links_artifact_id ON links(artifact_id);
-        CREATE INDEX IF NOT EXISTS idx_links_session ON links(session_id);
+        -- Covering index for the per-session listing (fetch_artifact_urls):
+        -- the join reads artifact ids straight from the index, never the links rows
+        CREATE INDEX IF NOT EXISTS idx_links_session_artifact ON links(session_id, artifact_id);
+        DROP INDEX IF EXISTS idx_links_session;                 -- prefix of the one above
         """
     )
+    # Databases created before inline storage lack the data column
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(artifacts)")}
+    if "data" not in columns:
+        conn.execute("ALTER TABLE artifacts ADD COLUMN data BLOB")
     conn.commit()
 
 
@@ -147,7 +280,9 @@ def ensure_artifact_store(custom_db_path: str | None = None, custom_blob_dir: st
     Initialize the artifact storage system.
     
     This is the main entry point for setting up artifact storage. It:
-    1. Creates the blob storage directory (if it doesn't exist)
+    1. Creates the blob storage directory (if it doesn't exist) and moves
+       blobs from the old aa/bb/<sha> layout to aa/<sha> (once; recorded
+       in the database's user_version)
     2. Creates the SQLite database with proper schema (if it doesn't exist)
     3. Sets up all necessary indexes for performance
     
@@ -171,6 +306,10 @@ def ensure_artifact_store(custom_db_path: str | None = None, custom_blob_dir: st
     # Create the database and schema
     with _connect(paths["db_path"]) as conn:
         _create_schema(conn)
+        # Walk the blobstore only until the one-time layout migration is recorded
+        if conn.execute("PRAGMA user_version;").fetchone()[0] < BLOB_LAYOUT_VERSION:
+            _migrate_blob_layout(paths["blob_dir"])
+            conn.execute(f"PRAGMA user_version = {BLOB_LAYOUT_VERSION};")
 
     return {
         "db_path": str(paths["db_path"]),
@@ -18,9 +18,9 @@ Security features:
 """
 
 from __future__ import annotations
-import base64, hmac, os, time, secrets
+import base64, functools, hmac, os, time, secrets
 from hashlib import sha256
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
 
 def _b64u(data: bytes) -> str:
     """
@@ -37,23 +37,47 @@ def _b64u_dec(s: str) -> bytes:
     pad = "=" * (-len(s) % 4)
     return base64.urlsafe_b64decode(s + pad)
 
+# Random per-process secret used when ARTIFACTS_SECRET is unset (development):
+# generated once, so tokens created here keep verifying here
+_DEV_SECRET = secrets.token_urlsafe(32).encode("utf-8")
+
+def _signing_key(env_secret: str | None) -> bytes:
+    """
+    Signing key for a given ARTIFACTS_SECRET value.
+
+    Without a secret (unset or empty) the process-wide _DEV_SECRET is used.
+    """
+    if env_secret:
+        return _env_signing_key(env_secret)
+    return _DEV_SECRET
+
+@functools.lru_cache(maxsize=4)
+def _env_signing_key(env_secret: str) -> bytes:
+    """Encode an ARTIFACTS_SECRET value once (cached)."""
+    return env_secret.encode("utf-8")
+
+@functools.lru_cache(maxsize=4)
+def _base_hmac(key: bytes) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 template; copied per message instead of re-keying."""
+    return hmac.new(key, digestmod=sha256)
+
 def _secret() -> bytes:
     """
     Get the secret key for token signing.
     
     Priority:
     1. ARTIFACTS_SECRET environment variable (for production)
-    2. Generate random secret (for development)
+    2. Random per-process secret (for development)
     
     This secret is used to sign all tokens, ensuring they can't be forged.
     """
-    # Try to use the fixed secret from environment first
-    env_secret = os.getenv("ARTIFACTS_SECRET")
-    if env_secret:
-        return env_secret.encode("utf-8")
-    
-    # Fall back to generating a random secret
-    return secrets.token_urlsafe(32).encode("utf-8")
+    return _signing_key(os.getenv("ARTIFACTS_SECRET"))
+
+def _sign(msg: bytes) -> bytes:
+    """HMAC-SHA256 of `msg` with the current secret."""
+    h = _base_hmac(_secret()).copy()
+    h.update(msg)
+    return h.digest()
 
 def _ttl() -> int:
     """
@@ -87,11 +111,15 @@ def create_token(artifact_id: str, now: int | None = None) -> str:
     # Calculate expiration time
     exp = now + _ttl()
     
+    return _token_for(artifact_id, exp)
+
+def _token_for(artifact_id: str, exp: int) -> str:
+    """Sign "artifact_id.exp" and encode it as <base64_message>.<base64_signature>."""
     # Create the message: "artifact_id.expiration_timestamp"
     msg = f"{artifact_id}.{exp}".encode("utf-8")
     
     # Sign the message with HMAC-SHA256 using our secret key
-    sig = hmac.new(_secret(), msg, sha256).digest()
+    sig = _sign(msg)
     
     # Encode both message and signature as URL-safe base64
     return _b64u(msg) + "." + _b64u(sig)
@@ -101,12 +129,14 @@ def verify_token(token: str) -> Dict[str, str | int]:
     Verify a token and return its contents if valid.
     
     Steps:
-    1. Split token into message and signature parts
+    1. Check the token shape and split it into message and signature parts
     2. Decode both from base64
     3. Extract artifact_id and expiration from message
     4. Verify the signature matches what we expect
     5. Check if token has expired
     
+    Steps 1-4 are cached per (token, secret); the expiry check runs every time.
+    
     Args:
         token: The token string to verify
     
@@ -116,31 +146,50 @@ def verify_token(token: str) -> Dict[str, str | int]:
     Raises:
         RuntimeError: If token is malformed, signature is invalid, or expired
     """
+    artifact_id, exp = _verify_signed(token, _secret())
+    
+    # Check if token has expired (every call: only the signature check is cached)
+    if int(time.time()) > exp:
+        raise RuntimeError("Token expired")
+
+    return {"artifact_id": artifact_id, "exp": exp}
+
+@functools.lru_cache(maxsize=4096)
+def _verify_signed(token: str, key: bytes) -> Tuple[str, int]:
+    """
+    Check the token's format and signature; return (artifact_id, exp).
+    
+    Memoized per (token, key): repeat downloads of the same link skip the
+    base64 decoding and HMAC work. Keying on the signing key means a changed
+    secret never reuses a cached result, and failures raise, so they are not
+    cached.
+    """
+    # Cheap structural check first: obviously malformed tokens never reach
+    # base64 decoding or HMAC work
+    if not token or token.count(".") != 1:
+        raise RuntimeError("Invalid token format")
+    msg_b64, sig_b64 = token.split(".", 1)
+    if not msg_b64 or not sig_b64:
+        raise RuntimeError("Invalid token format")
+
     try:
-        # Split token into message and signature parts
-        msg_b64, sig_b64 = token.split(".", 1)
-        
         # Decode from base64
         msg = _b64u_dec(msg_b64)
         sig = _b64u_dec(sig_b64)
         
-        # Extract artifact_id and expiration from message
-        exp_str = msg.decode("utf-8").rsplit(".", 1)[1]
-        artifact_id = msg.decode("utf-8").rsplit(".", 1)[0]
+        # Extract artifact_id and expiration from message (decode/split once)
+        artifact_id, exp_str = msg.decode("utf-8").rsplit(".", 1)
         exp = int(exp_str)
     except Exception:
         raise RuntimeError("Invalid token format")
 
-    # Verify the signature matches what we expect
-    expected = hmac.new(_secret(), msg, sha256).digest()
-    if not hmac.compare_digest(sig, expected):
+    # Verify the signature matches what we expect (constant-time, on raw digest bytes)
+    h = _base_hmac(key).copy()
+    h.update(msg)
+    if not hmac.compare_digest(sig, h.digest()):
         raise RuntimeError("Invalid token signature")
-    
-    # Check if token has expired
-    if int(time.time()) > exp:
-        raise RuntimeError("Token expired")
 
-    return {"artifact_id": artifact_id, "exp": exp}
+    return artifact_id, exp
 
 def create_download_url(artifact_id: str) -> str:
     """
@@ -160,17 +209,37 @@ def create_download_url(artifact_id: str) -> str:
     Returns:
         Complete URL string (e.g., "http://localhost:8002/artifacts/art_abc123?token=xyz789")
     """
-    # Check for custom base URL first (set in docker-compose.yml)
-    base = os.getenv("ARTIFACTS_PUBLIC_BASE_URL")
-    if base:
-        base = base.rstrip("/")
-    else:
-        # Use dynamic port from environment, fallback to 8000
-        port = os.getenv("ARTIFACTS_SERVER_PORT", "8000")
-        base = f"http://localhost:{port}"
+    base = _public_base_url()
     
     # Create a signed token for this artifact
     token = create_token(artifact_id)
     
     # Combine everything into a complete URL
     return f"{base}/artifacts/{artifact_id}?token={token}"
+
+def create_download_urls(artifact_ids: Iterable[str]) -> List[str]:
+    """
+    Build download URLs for several artifacts at once.
+    
+    Same URLs as create_download_url, but the base URL, TTL and expiration are
+    resolved once for the whole batch instead of once per artifact.
+    
+    Args:
+        artifact_ids: The artifact identifiers, in the order URLs should be returned
+    
+    Returns:
+        List of complete URL strings, one per artifact id
+    """
+    base = _public_base_url()
+    exp = int(time.time()) + _ttl()
+    return [f"{base}/artifacts/{aid}?token={_token_for(aid, exp)}" for aid in artifact_ids]
+
+def _public_base_url() -> str:
+    """Base URL of the artifact server, without trailing slash."""
+    # Check for custom base URL first (set in docker-compose.yml)
+    base = os.getenv("ARTIFACTS_PUBLIC_BASE_URL")
+    if base:
+        return base.rstrip("/")
+    # Use dynamic port from environment, fallback to 8000
+    port = os.getenv("ARTIFACTS_SERVER_PORT", "8000")
+    return f"http://localhost:{port}"
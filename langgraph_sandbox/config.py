@@ -1,11 +1,12 @@
 # langgraph_sandbox/config.py
 from __future__ import annotations
 
+import functools
 import os
 from enum import Enum
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 
 class SessionStorage(str, Enum):
@@ -22,6 +23,29 @@ class DatasetAccess(str, Enum):
     HYBRID = "HYBRID"        # API + local datasets mounted at /hybrid_data
 
 
+# Variables read by Config.from_env; only these (and the cwd) affect the result.
+ENV_KEYS = (
+    "SESSION_STORAGE",
+    "DATASET_ACCESS",
+    "SESSIONS_ROOT",
+    "DATASETS_HOST_RO",
+    "HYBRID_LOCAL_PATH",
+    "BLOBSTORE_DIR",
+    "ARTIFACTS_DB",
+    "CACHE_FILENAME",
+    "SANDBOX_IMAGE",
+    "TMPFS_SIZE_MB",
+    "SANDBOX_PREWARM",
+    "IN_CHAT_URL",
+    "SANDBOX_ADDRESS_STRATEGY",
+    "COMPOSE_NETWORK",
+    "HOST_GATEWAY",
+)
+
+# Parsed env files: path -> ((st_mtime_ns, st_size), vars)
+_env_file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
 @dataclass(frozen=True)
 class Config:
     # --- core knobs (defaults are recommended prod/demo) ---
@@ -39,6 +63,7 @@ class Config:
     # --- docker bits / misc ---
     sandbox_image: str = "sandbox:latest"
     tmpfs_size_mb: int = 1024  # only used when SessionStorage=TMPFS
+    sandbox_prewarm: int = 0   # containers to start ahead of time (TMPFS only, see SessionManager.prewarm)
 
     # --- artifact display options ---
     in_chat_url: bool = False  # Include artifact URLs directly in chat content
@@ -121,6 +146,16 @@ class Config:
         if env_file_path is None:
             return {}
         
+        # Memoized on the file's mtime/size: from_env runs on every tool call
+        try:
+            st = env_file_path.stat()
+        except FileNotFoundError:
+            return {}
+        stamp = (st.st_mtime_ns, st.st_size)
+        hit = _env_file_cache.get(env_file_path)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+
         env_vars = {}
         if env_file_path.exists():
             with open(env_file_path, 'r', encoding='utf-8') as f:
@@ -136,6 +171,7 @@ class Config:
                         if '#' in value:
                             value = value.split('#')[0]
                         env_vars[key.strip()] = value.strip()
+        _env_file_cache[env_file_path] = (stamp, env_vars)
         return env_vars
 
     @staticmethod
@@ -183,6 +219,7 @@ class Config:
           - CACHE_FILENAME  = cache_datasets.json     (default: cache_datasets.json)
           - SANDBOX_IMAGE   = sandbox:latest
           - TMPFS_SIZE_MB   = 1024
+          - SANDBOX_PREWARM = 0                      (containers started ahead of time, TMPFS only)
           - IN_CHAT_URL     = true | false           (default: false)
           - SANDBOX_ADDRESS_STRATEGY = container | host  (default: container)
           - COMPOSE_NETWORK  = network_name             (optional)
@@ -203,6 +240,21 @@ class Config:
             if key not in os.environ:  # Don't override existing env vars
                 os.environ[key] = value
         
+        # Config is frozen, so instances can be shared: memoize on the effective
+        # values (file first, then system env) plus the cwd relative paths resolve against
+        snapshot = tuple(
+            (k, env_vars[k] if k in env_vars else os.environ[k])
+            for k in ENV_KEYS
+            if k in env_vars or k in os.environ
+        )
+        return cls._from_snapshot(os.getcwd(), snapshot)
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _from_snapshot(cls, cwd: str, snapshot: Tuple[Tuple[str, str], ...]) -> "Config":
+        """Build a Config from an env snapshot (see from_env); cached per (cwd, snapshot)."""
+        env_vars = dict(snapshot)
+
         session_storage = cls._get_env_enum("SESSION_STORAGE", SessionStorage, SessionStorage.TMPFS, env_vars)
         dataset_access  = cls._get_env_enum("DATASET_ACCESS",  DatasetAccess,  DatasetAccess.API, env_vars)
 
@@ -219,6 +271,7 @@ class Config:
         cache_filename  = cls._get_env_value("CACHE_FILENAME", "cache_datasets.json", env_vars)
         sandbox_image   = cls._get_env_value("SANDBOX_IMAGE", "sandbox:latest", env_vars)
         tmpfs_size_mb   = int(cls._get_env_value("TMPFS_SIZE_MB", "1024", env_vars))
+        sandbox_prewarm = int(cls._get_env_value("SANDBOX_PREWARM", "0", env_vars))
         in_chat_url     = cls._get_env_value("IN_CHAT_URL", "false", env_vars).lower() in ("true", "1", "yes")
         
         # Network configuration
@@ -249,6 +302,7 @@ class Config:
             cache_filename=cache_filename,
             sandbox_image=sandbox_image,
             tmpfs_size_mb=tmpfs_size_mb,
+            sandbox_prewarm=sandbox_prewarm,
             in_chat_url=in_chat_url,
             sandbox_address_strategy=sandbox_address_strategy,
             compose_network=compose_network,
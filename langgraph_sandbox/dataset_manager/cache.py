@@ -4,7 +4,7 @@ import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ..config import Config
 
@@ -47,18 +47,34 @@ def cache_file_path(cfg: Config, session_id: str) -> Path:
     return cfg.session_dir(session_id) / cfg.cache_filename
 
 
+# In-process memo of parsed cache files: path -> ((st_mtime_ns, st_size), data).
+# Tools read the cache on every call while it rarely changes between calls, so a
+# stat() is enough to tell whether the file must be parsed again.
+_parsed_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, List[Dict[str, str]]]]] = {}
+
+
 def _read_cache_data(cfg: Config, session_id: str) -> Dict[str, List[Dict[str, str]]]:
-    """Read the raw cache data from file."""
+    """Read the raw cache data from file (memoized on the file's mtime/size)."""
     p = cache_file_path(cfg, session_id)
-    if not p.exists():
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        _parsed_cache.pop(p, None)
         return {"datasets": []}
-    
+
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _parsed_cache.get(p)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+
     try:
         with open(p, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            data = json.load(f)
     except (json.JSONDecodeError, FileNotFoundError):
         # If file is corrupted or doesn't exist, return empty cache
         return {"datasets": []}
+    _parsed_cache[p] = (key, data)
+    return data
 
 
 def _write_cache_data(cfg: Config, session_id: str, data: Dict[str, List[Dict[str, str]]]) -> Path:
@@ -73,6 +89,10 @@ def _write_cache_data(cfg: Config, session_id: str, data: Dict[str, List[Dict[st
         tmp.flush()
         tmp_path = Path(tmp.name)
     tmp_path.replace(p)
+    # Write-through: memoize what we just wrote under the new file's stat, so
+    # the read-modify-write cycle of add_entry never re-parses our own output.
+    st = p.stat()
+    _parsed_cache[p] = ((st.st_mtime_ns, st.st_size), data)
     return p
 
 
@@ -129,15 +149,13 @@ def write_entries(cfg: Config, session_id: str, entries: Iterable[DatasetEntry])
     Overwrite the cache file with the given entries (de-duplicated, in order).
     Returns the path to the cache file.
     """
-    unique: List[DatasetEntry] = []
-    seen = set()
+    # dict keeps the first entry per id, in insertion order
+    unique: Dict[str, DatasetEntry] = {}
     for entry in entries:
-        if not entry.id or entry.id in seen:
-            continue
-        seen.add(entry.id)
-        unique.append(entry)
+        if entry.id:
+            unique.setdefault(entry.id, entry)
     
-    data = {"datasets": [entry.to_dict() for entry in unique]}
+    data = {"datasets": [entry.to_dict() for entry in unique.values()]}
     return _write_cache_data(cfg, session_id, data)
 
 
@@ -190,6 +208,32 @@ def update_entry_status(cfg: Config, session_id: str, ds_id: str, status: str) -
     return add_entry(cfg, session_id, ds_id, status)
 
 
+def update_entries_status(cfg: Config, session_id: str, ds_ids: Iterable[str], status: str) -> Path:
+    """
+    Add or update several dataset entries with one cache write (one read-modify-write
+    cycle instead of one per id). Returns the cache file path.
+    """
+    ids = list(dict.fromkeys(ds_ids))
+    if not ids:
+        return cache_file_path(cfg, session_id)
+
+    entries = read_entries(cfg, session_id)
+    by_id = {entry.id: entry for entry in entries}
+    timestamp = datetime.utcnow().isoformat() + "Z"
+
+    for ds_id in ids:
+        entry = by_id.get(ds_id)
+        if entry is None:
+            entry = DatasetEntry(id=ds_id, status=status, timestamp=timestamp)
+            entries.append(entry)
+            by_id[ds_id] = entry
+        else:
+            entry.status = status
+            entry.timestamp = timestamp
+
+    return write_entries(cfg, session_id, entries)
+
+
 def clear_cache(cfg: Config, session_id: str) -> Path:
     """
     Clear the cache file by writing an empty list. Returns the cache file path.
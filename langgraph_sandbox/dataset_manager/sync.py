@@ -3,8 +3,8 @@ from __future__ import annotations
 
 from typing import Dict, List
 from ..config import Config
-from .staging import stage_dataset_into_sandbox, container_staged_path, container_ro_path, container_hybrid_path
-from .cache import DatasetStatus, update_entry_status
+from .staging import stage_datasets_into_sandbox, container_staged_path, container_ro_path, container_hybrid_path
+from .cache import DatasetStatus, update_entry_status, update_entries_status
 
 async def load_pending_datasets(
     *,
@@ -35,7 +35,10 @@ async def load_pending_datasets(
     Raises:
         Exception: If loading fails for any dataset
     """
-    out: List[Dict[str, str]] = []
+    descs: Dict[str, Dict[str, str]] = {}
+    to_stage: List[str] = []
+    # Status updates are collected and written to the cache file in one go
+    loaded: List[str] = []
     
     for ds_id in ds_ids:
         try:
@@ -46,39 +49,50 @@ async def load_pending_datasets(
                 if local_file_path.exists():
                     # Dataset exists locally, use it (like LOCAL_RO mode)
                     path = container_hybrid_path(cfg, ds_id) # it's mounted at /heavy_data so use hybrid path
-                    desc = {
+                    descs[ds_id] = {
                         "id": ds_id,
                         "path_in_container": path,
                     }
-                    update_entry_status(cfg, session_id, ds_id, DatasetStatus.LOADED)
-                    out.append(desc)
+                    loaded.append(ds_id)
                     continue
             
             if cfg.uses_api_staging:
-                # API mode: actually fetch and stage the dataset
-                desc = await stage_dataset_into_sandbox(
-                    cfg=cfg,
-                    session_id=session_id,
-                    container=container,
-                    ds_id=ds_id,
-                    fetch_fn=fetch_fn,
-                )
-                # Mark as LOADED after successful staging
-                update_entry_status(cfg, session_id, ds_id, DatasetStatus.LOADED)
+                # API mode: fetched and staged below, all in one batch
+                to_stage.append(ds_id)
             else:
                 # RO mode: just update cache status, assume file exists
                 path = container_ro_path(cfg, ds_id) # it's mounted at start so just fetch path
-                desc = {
+                descs[ds_id] = {
                     "id": ds_id,
                     "path_in_container": path,
                 }
-                update_entry_status(cfg, session_id, ds_id, DatasetStatus.LOADED)
-            
-            out.append(desc)
+                loaded.append(ds_id)
             
         except Exception as e:
             # Mark as FAILED and re-raise
+            update_entries_status(cfg, session_id, loaded, DatasetStatus.LOADED)
             update_entry_status(cfg, session_id, ds_id, DatasetStatus.FAILED)
             raise Exception(f"Failed to load dataset {ds_id}: {e}")
     
-    return out
+    if to_stage:
+        # Single put_archive for all API datasets instead of one per dataset
+        try:
+            staged = await stage_datasets_into_sandbox(
+                cfg=cfg,
+                session_id=session_id,
+                container=container,
+                ds_ids=to_stage,
+                fetch_fn=fetch_fn,
+            )
+        except Exception as e:
+            # Mark the whole batch as FAILED and re-raise
+            update_entries_status(cfg, session_id, loaded, DatasetStatus.LOADED)
+            update_entries_status(cfg, session_id, to_stage, DatasetStatus.FAILED)
+            raise Exception(f"Failed to load dataset {', '.join(to_stage)}: {e}")
+        # Mark as LOADED after successful staging
+        for desc in staged:
+            descs[desc["id"]] = desc
+            loaded.append(desc["id"])
+    
+    update_entries_status(cfg, session_id, loaded, DatasetStatus.LOADED)
+    return [descs[ds_id] for ds_id in ds_ids]
@@ -12,23 +12,25 @@ Usage:
 """
 
 from cmd import PROMPT
+import asyncio
 import sys
-import os
+import traceback
 import uuid
-import threading
-import time
 from pathlib import Path
 from datetime import datetime
 
 from langgraph.checkpoint.memory import InMemorySaver
 from dotenv import load_dotenv
-from fastapi import FastAPI
-import uvicorn
+
+try:
+    import uvloop  # faster event loop; not available on Windows
+except ImportError:
+    uvloop = None
 
 try:
     # Try relative imports first (when used as a module)
     from .artifacts.store import ensure_artifact_store
-    from .artifacts.api import router as artifacts_router
+    from .artifacts.server import start_artifact_server
     from .config import Config
     from .sandbox.container_utils import cleanup_sandbox_containers
     from .sandbox.session_manager import SessionStorage
@@ -36,7 +38,7 @@ try:
 except ImportError:
     # Fall back to absolute imports (when run directly)
     from artifacts.store import ensure_artifact_store
-    from artifacts.api import router as artifacts_router
+    from artifacts.server import start_artifact_server
     from config import Config
     from sandbox.container_utils import cleanup_sandbox_containers
     from sandbox.session_manager import SessionStorage
@@ -94,6 +96,8 @@ def main():
         compose_network=cfg.compose_network,
         host_gateway=cfg.host_gateway,
     )
+    # Start the sandbox container in the background while the user types
+    session_manager.prewarm(cfg.sandbox_prewarm)
     
     # Create tools with session key function
     def get_session_key():
@@ -109,60 +113,17 @@ def main():
         session_key_fn=get_session_key
     )
     
-    # Set up FastAPI for artifacts
-    app = FastAPI()
-    app.include_router(artifacts_router)
-    
-    # Start artifact server with port fallback
-    server_port = [0]  # Use a list to make it mutable
-    
-    def run_server():
-        ports_to_try = [8000, 8001, 8002, 8003, 8004]
-        for port in ports_to_try:
-            try:
-                server_port[0] = port
-                # Set the server port in environment for URL generation
-                os.environ["ARTIFACTS_SERVER_PORT"] = str(port)
-                # Suppress uvicorn's error output by redirecting stderr temporarily
-                import sys
-                from contextlib import redirect_stderr
-                from io import StringIO
-                
-                # Capture uvicorn's stderr to suppress the port error message
-                stderr_capture = StringIO()
-                with redirect_stderr(stderr_capture):
-                    uvicorn.run(app, host="0.0.0.0", port=port, log_level="error")
-                break  # Success, exit the loop
-            except OSError as e:
-                if "address already in use" in str(e).lower():
-                    if port == ports_to_try[0]:  # Only show warning for first attempt
-                        print(f"⚠️  Port {port} is already in use (likely by Docker Compose), trying alternative port...")
-                    continue  # Try next port
-                else:
-                    print(f"Server error: {e}")
-                    break
-            except Exception as e:
-                print(f"Server error: {e}")
-                break
-    
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
-    time.sleep(2)  # Give server time to start
+    # Start the artifact server (falls back to a free port if 8000 is taken)
+    server_port = start_artifact_server()
     
     # Report the actual port used
-    if server_port[0]:
-        print(f"✅ Artifact server started on http://localhost:{server_port[0]}")
-    else:
-        print("✅ Artifact server started")
+    print(f"✅ Artifact server started on http://localhost:{server_port}")
 
     # Create simple graph
-    from langgraph.graph import StateGraph, MessagesState, END
     from langchain_openai import ChatOpenAI
     from langgraph.graph import StateGraph, MessagesState, START, END
     from langchain_core.messages import AIMessage, HumanMessage
-    from langchain_openai import ChatOpenAI
     from langgraph.prebuilt import create_react_agent
-    from langgraph.checkpoint.memory import InMemorySaver
 
     PROMPT = """
             You are a helpful AI assistant that writes Python code to run in a Docker sandbox.
@@ -214,6 +175,10 @@ def main():
     print("Type '/bye' to exit.")
     print("=" * 60)
 
+    # One event loop for the whole conversation (uvloop if installed): async
+    # clients and connection pools created while streaming stay usable across turns
+    runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+
     # Interactive loop
     while True:
         try:
@@ -226,8 +191,6 @@ def main():
             print("\n🤖 AI: ", end="", flush=True)
             
             # Run the conversation with timeout
-            import asyncio
-            
             async def run_conversation():
                 artifacts_log = []
                 try:
@@ -270,7 +233,7 @@ def main():
             
             # Run with proper signal handling
             try:
-                asyncio.run(run_conversation())
+                runner.run(run_conversation())
             except KeyboardInterrupt:
                 print("\n⏹️  Interrupted by user")
                 break
@@ -281,9 +244,11 @@ def main():
             break
         except Exception as e:
             print(f"\n❌ Error: {e}")
-            import traceback
             traceback.print_exc()
     
+    runner.close()
+    # Remove pre-started containers no session adopted
+    session_manager.shutdown_prewarmed()
     print("✅ Session ended")
 
 if __name__ == "__main__":
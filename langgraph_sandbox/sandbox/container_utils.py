@@ -3,17 +3,21 @@ Utility functions for Docker container management in the sandbox system.
 """
 
 import docker
+from concurrent.futures import ThreadPoolExecutor
 from docker import errors
 from typing import List, Optional
 
 
-def cleanup_sandbox_containers(container_prefix: str = "sbox-", verbose: bool = True) -> List[str]:
+def cleanup_sandbox_containers(
+    container_prefix: str = "sbox-", verbose: bool = True, client: Optional[docker.DockerClient] = None
+) -> List[str]:
     """
     Clean up existing sandbox containers to avoid conflicts.
     
     Args:
         container_prefix: Prefix to match container names (default: "sbox-")
         verbose: Whether to print cleanup messages
+        client: Docker client to reuse (default: a new one from the environment)
         
     Returns:
         List of container names that were removed
@@ -24,18 +28,19 @@ def cleanup_sandbox_containers(container_prefix: str = "sbox-", verbose: bool =
     removed_containers = []
     
     try:
-        client = docker.from_env()
+        client = client or docker.from_env()
         containers = client.containers.list(all=True, filters={"name": container_prefix})
         
         if verbose and containers:
             print(f"Cleaning up {len(containers)} existing sandbox containers...")
         
-        for container in containers:
+        # Remove concurrently: the daemon handles removals in parallel, and
+        # force=True kills running containers instead of a graceful stop (up to 10s each)
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(containers)))) as pool:
+            futures = [pool.submit(container.remove, force=True) for container in containers]
+        for container, future in zip(containers, futures):
             try:
-                # Only stop if container is running
-                if container.status == "running":
-                    container.stop()
-                container.remove()
+                future.result()
                 removed_containers.append(container.name)
                 if verbose:
                     print(f"  Removed container: {container.name}")
@@ -51,13 +56,16 @@ def cleanup_sandbox_containers(container_prefix: str = "sbox-", verbose: bool =
     return removed_containers
 
 
-def cleanup_specific_containers(container_names: List[str], verbose: bool = True) -> List[str]:
+def cleanup_specific_containers(
+    container_names: List[str], verbose: bool = True, client: Optional[docker.DockerClient] = None
+) -> List[str]:
     """
     Clean up specific containers by name.
     
     Args:
         container_names: List of container names to remove
         verbose: Whether to print cleanup messages
+        client: Docker client to reuse (default: a new one from the environment)
         
     Returns:
         List of container names that were successfully removed
@@ -65,7 +73,7 @@ def cleanup_specific_containers(container_names: List[str], verbose: bool = True
     removed_containers = []
     
     try:
-        client = docker.from_env()
+        client = client or docker.from_env()
         
         for container_name in container_names:
             try:
@@ -90,19 +98,22 @@ def cleanup_specific_containers(container_names: List[str], verbose: bool = True
     return removed_containers
 
 
-def list_sandbox_containers(container_prefix: str = "sbox-", running_only: bool = False) -> List[str]:
+def list_sandbox_containers(
+    container_prefix: str = "sbox-", running_only: bool = False, client: Optional[docker.DockerClient] = None
+) -> List[str]:
     """
     List existing sandbox containers.
     
     Args:
         container_prefix: Prefix to match container names (default: "sbox-")
         running_only: If True, only return running containers
+        client: Docker client to reuse (default: a new one from the environment)
         
     Returns:
         List of container names
     """
     try:
-        client = docker.from_env()
+        client = client or docker.from_env()
         containers = client.containers.list(all=not running_only, filters={"name": container_prefix})
         return [container.name for container in containers]
     except Exception as e:
@@ -5,12 +5,13 @@ import tarfile
 import time
 import shlex
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+from docker import errors
 
-def _tar_single_file_bytes(
-    dst_name: str,
-    data: bytes,
+
+def _tar_files_bytes(
+    files: Dict[str, bytes],
     *,
     mode: int = 0o644,
     mtime: Optional[int] = None,
@@ -18,36 +19,71 @@ def _tar_single_file_bytes(
     gid: int = 0,
 ) -> bytes:
     """
-    Create an in-memory tar archive with a single file entry named `dst_name`.
+    Create an in-memory tar archive with one file entry per `files` item
+    (entry name -> content).
 
     Notes:
-      - Preserves the full directory structure in the tar.
-      - `mtime` defaults to current time for stable archives if provided.
+      - Entry names are used as-is (directory structure preserved).
+      - `mtime` defaults to current time; pass it for stable archives.
     """
-    if not dst_name:
-        raise ValueError("dst_name must include a filename")
+    if not files or any(not name for name in files):
+        raise ValueError("every tar entry must have a filename")
 
     if mtime is None:
         mtime = int(time.time())
 
     buf = io.BytesIO()
-    with tarfile.open(fileobj=buf, mode="w") as tar:
-        info = tarfile.TarInfo(name=dst_name)  # Use full path, not just basename
-        info.size = len(data)
-        info.mode = mode
-        info.mtime = mtime
-        info.uid = uid
-        info.gid = gid
-        tar.addfile(info, io.BytesIO(data))
-    buf.seek(0)
+    # Stream mode ("w|"): the archive is written sequentially into memory, no seeks
+    with tarfile.open(fileobj=buf, mode="w|") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name=name)  # Use full path, not just basename
+            info.size = len(data)
+            info.mode = mode
+            info.mtime = mtime
+            info.uid = uid
+            info.gid = gid
+            tar.addfile(info, io.BytesIO(data))
     return buf.getvalue()
 
 
+def _tar_single_file_bytes(
+    dst_name: str,
+    data: bytes,
+    *,
+    mode: int = 0o644,
+    mtime: Optional[int] = None,
+    uid: int = 0,
+    gid: int = 0,
+) -> bytes:
+    """
+    Create an in-memory tar archive with a single file entry named `dst_name`.
+    """
+    if not dst_name:
+        raise ValueError("dst_name must include a filename")
+    return _tar_files_bytes({dst_name: data}, mode=mode, mtime=mtime, uid=uid, gid=gid)
+
+
+def _put_archive(container, parent: str, tar_bytes: bytes) -> None:
+    """put_archive into `parent`, creating the directory only if Docker reports it missing."""
+    try:
+        container.put_archive(path=parent, data=tar_bytes)
+    except errors.NotFound:
+        # Parent directory missing: create it (Python is more reliable than mkdir) and retry
+        container.exec_run(
+            ["python3", "-c", f"import os; os.makedirs({parent!r}, exist_ok=True)"]
+        )
+        container.put_archive(path=parent, data=tar_bytes)
+
+
 def put_bytes(container, container_path: str, data: bytes, *, mode: int = 0o644) -> None:
     """
     Write `data` to `container_path` inside the container by streaming a single-file
     tar to Docker's put_archive. Overwrites any existing file.
 
+    The parent directory is only created (one extra exec round-trip) when Docker
+    reports it missing. The archive is sent uncompressed: Docker's archive endpoint
+    does not accept zstd, and dataset payloads (parquet) are already compressed.
+
     Parameters
     ----------
     container : docker.models.containers.Container (duck-typed here)
@@ -59,22 +95,16 @@ def put_bytes(container, container_path: str, data: bytes, *, mode: int = 0o644)
     if not container_path or container_path.endswith("/"):
         raise ValueError("container_path must be a file path, not a directory")
 
-    parent = str(Path(container_path).parent).lstrip("/")
+    parent = "/" + str(Path(container_path).parent).lstrip("/")
     name_in_tar = str(Path(container_path).name)
 
     # Create tar with just the filename (no directory structure)
     tar_bytes = _tar_single_file_bytes(name_in_tar, data, mode=mode)
 
-    # Ensure parent directory exists using Python (more reliable than mkdir)
-    rc, output = container.exec_run(
-        ["python3", "-c", f"import os; os.makedirs('/{parent}', exist_ok=True)"]
-    )
-
-
     # Try put_archive first, but fallback to direct write if it fails
     try:
-        ok = container.put_archive(path="/data", data=tar_bytes)
-        
+        _put_archive(container, parent, tar_bytes)
+
         # Verify the file was actually written
         rc, output = container.exec_run(["ls", "-la", container_path])
         
@@ -90,6 +120,44 @@ def put_bytes(container, container_path: str, data: bytes, *, mode: int = 0o644)
     _write_small_file_base64(container, container_path, data)
 
 
+def put_many_bytes(container, container_dir: str, files: Dict[str, bytes], *, mode: int = 0o644) -> None:
+    """
+    Write several files into `container_dir` with a single put_archive call
+    (one Docker round-trip instead of one per file), then verify them all with
+    one `ls`. Falls back to put_bytes per file if the batch write fails.
+
+    Parameters
+    ----------
+    container : docker.models.containers.Container (duck-typed here)
+    container_dir : str           Absolute destination directory in the container.
+    files : Dict[str, bytes]      Filename (no directories) -> content.
+    mode : int                    File mode for the created files (default 0644).
+    """
+    if not files:
+        return
+    if any("/" in name for name in files):
+        raise ValueError("file names must not contain directories")
+
+    parent = "/" + container_dir.strip("/")
+    paths = [f"{parent.rstrip('/')}/{name}" for name in files]
+
+    try:
+        _put_archive(container, parent, _tar_files_bytes(files, mode=mode))
+
+        # Verify all files were actually written
+        rc, output = container.exec_run(["ls", "-la", *paths])
+        if rc == 0:
+            print(f"{len(files)} file(s) written to container")
+            return
+        else:
+            print(f"files not found in container, writing one by one...")
+    except Exception as e:
+        print(f"put_archive exception: {e}, writing one by one...")
+
+    for path, data in zip(paths, files.values()):
+        put_bytes(container, path, data, mode=mode)
+
+
 def _write_small_file_base64(container, container_path: str, data: bytes) -> None:
     """Write small files using base64 method."""
     import base64
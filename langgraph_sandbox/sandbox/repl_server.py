@@ -1,5 +1,6 @@
 # repl_server.py
-import io, traceback, asyncio
+import io, os, traceback, asyncio
+from collections import deque
 from contextlib import redirect_stdout
 from fastapi import FastAPI
 from pydantic import BaseModel
@@ -11,6 +12,53 @@ app = FastAPI()
 # One long-lived namespace => variables persist across calls
 GLOBAL_NS = {"__name__": "__main__"}
 
+# Only the tail of stdout is kept per call, so runaway prints can't exhaust memory
+MAX_STDOUT_CHARS = int(os.getenv("REPL_MAX_STDOUT_CHARS", "100000"))
+
+
+class TailBuffer(io.TextIOBase):
+    """Write-only text sink keeping only the last `limit` characters (O(limit) memory)."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.dropped = 0
+        self._chunks = deque()
+        self._size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        n = len(s)
+        if n >= self.limit:
+            # The new chunk alone fills the buffer
+            self.dropped += self._size + n - self.limit
+            self._chunks.clear()
+            self._chunks.append(s[n - self.limit:])
+            self._size = self.limit
+            return n
+        self._chunks.append(s)
+        self._size += n
+        while self._size > self.limit:
+            excess = self._size - self.limit
+            head = self._chunks[0]
+            if len(head) <= excess:
+                self._chunks.popleft()
+                cut = len(head)
+            else:
+                self._chunks[0] = head[excess:]
+                cut = excess
+            self._size -= cut
+            self.dropped += cut
+        return n
+
+    def getvalue(self):
+        text = "".join(self._chunks)
+        if self.dropped:
+            return f"[... {self.dropped} characters of earlier output truncated ...]\n{text}"
+        return text
+
+
 class ExecRequest(BaseModel):
     code: str
     timeout: int | None = 120  # seconds
@@ -21,7 +69,7 @@ def health():
 
 @app.post("/exec")
 async def exec_code(req: ExecRequest):
-    out = io.StringIO()
+    out = TailBuffer(MAX_STDOUT_CHARS)
     try:
         # Optional: simple timeout guard
         async def run():
@@ -8,8 +8,10 @@ import os
 import shlex
 import json
 import socket
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Deque, Dict, Optional, List
 
 import docker            # Host-side Docker SDK (controls containers)
 from docker import errors
@@ -53,6 +55,21 @@ DEFAULT_IMAGE = "sandbox:latest"
 IDLE_TIMEOUT_SECS = 45 * 60  # 45 minutes (tune to your infra)
 
 
+def _scandir_files(root: str):
+    """
+    Recursively yield os.DirEntry objects for the regular files under `root`.
+
+    Uses os.scandir: file types come from the directory listing itself, so no
+    extra stat() per entry (unlike Path.rglob + is_file). Symlinks are not followed.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
 class SessionInfo:
     """
     Lightweight record for one live session/container.
@@ -64,19 +81,23 @@ class SessionInfo:
       when SessionStorage.BIND; None when SessionStorage.TMPFS.
     - session_storage: which session backing store is used (TMPFS or BIND).
     - last_used: unix timestamp, used to evict idle sessions.
+    - container: cached Docker container handle, so hot paths (exec, staging)
+      don't pay a daemon round-trip to look it up again on every call.
     """
     def __init__(
         self,
         container_id: str,
         host_port: int,
         session_dir: Path | None,
-        session_storage: SessionStorage
+        session_storage: SessionStorage,
+        container=None,
     ):
         self.container_id = container_id
         self.host_port = host_port
         self.session_dir = session_dir
         self.session_storage = session_storage
         self.last_used = time.time()
+        self.container = container
 
 
 class SessionManager:
@@ -162,6 +183,10 @@ class SessionManager:
         # In-memory registry: session_key -> SessionInfo
         self.sessions: Dict[str, SessionInfo] = {}
 
+        # Containers being started ahead of time by prewarm(), adopted by start()
+        self._warm: Deque[Future] = deque()
+        self._warm_executor: Optional[ThreadPoolExecutor] = None
+
     def _get_repl_url(self, session_key: str) -> str:
         """
         Get the REPL URL for a session based on address strategy.
@@ -441,7 +466,7 @@ with open('/session/python_state.json', 'w') as f:
             if self.session_storage == SessionStorage.BIND:
                 sess_dir = (self.session_root / sid).resolve()
                 sess_dir.mkdir(parents=True, exist_ok=True)
-            self.sessions[sid] = SessionInfo(existing.id or "", host_port, sess_dir, self.session_storage)
+            self.sessions[sid] = SessionInfo(existing.id or "", host_port, sess_dir, self.session_storage, existing)
             return sid
         except errors.NotFound:
             pass  # create a new container
@@ -454,6 +479,64 @@ with open('/session/python_state.json', 'w') as f:
             except:
                 pass  # Ignore errors when removing problematic container
 
+        # Ensure no container with this name exists before creating
+        try:
+            existing_container = self.client.containers.get(name)
+            # If we get here, a container with this name exists
+            existing_container.stop()
+            existing_container.remove()
+        except errors.NotFound:
+            # No existing container, which is what we want
+            pass
+        except Exception as e:
+            # If there's any issue removing the existing container, log it but continue
+            print(f"Warning: Could not remove existing container {name}: {e}")
+
+        # Adopt a container started ahead of time by prewarm(), else run a new one
+        container = self._take_warm_container(name)
+        warm = container is not None
+        if not warm:
+            container = self._run_container(name, sess_dir)
+
+        host_port = self._repl_host_port(container)
+
+        # Register session first so we can use _get_repl_url
+        self.sessions[sid] = SessionInfo(container.id or "", host_port, sess_dir, self.session_storage, container)
+
+        if not warm:
+            # Pre-started containers were probed and prepared in the background already
+            self._wait_ready(self._get_repl_url(sid))
+            self._prepare_container_dirs(container)
+        
+        # Write initial session metadata (BIND mode only)
+        if self.session_storage == SessionStorage.BIND:
+            initial_metadata = {
+                "session_id": sid,
+                "created_at": datetime.now().isoformat(),
+                "container_id": container.id,
+                "host_port": host_port,
+                "session_storage": self.session_storage.value,
+                "dataset_access": self.dataset_access.value,
+                "image": self.image,
+                "execution_count": 0,
+                "last_used": datetime.now().isoformat()
+            }
+            self._write_session_metadata(sid, initial_metadata)
+            
+            # Log session start
+            self._write_session_log(sid, {
+                "event": "session_started",
+                "container_id": container.id,
+                "host_port": host_port
+            })
+        
+        return sid
+
+    def _run_container(self, name: str, sess_dir: Optional[Path]):
+        """
+        Run a new sandbox container named `name` with this manager's mounts and
+        network settings (see start()). sess_dir is the /session bind source in BIND mode.
+        """
         # Build mounts
         volumes: Dict[str, Dict[str, str]] = {}
         tmpfs: Dict[str, str] = {}
@@ -492,19 +575,6 @@ with open('/session/python_state.json', 'w') as f:
             ports = {"9000/tcp": None}  # random host port for REPL
             network = None
 
-        # Ensure no container with this name exists before creating
-        try:
-            existing_container = self.client.containers.get(name)
-            # If we get here, a container with this name exists
-            existing_container.stop()
-            existing_container.remove()
-        except errors.NotFound:
-            # No existing container, which is what we want
-            pass
-        except Exception as e:
-            # If there's any issue removing the existing container, log it but continue
-            print(f"Warning: Could not remove existing container {name}: {e}")
-
         # Run container
         container = self.client.containers.run(
             self.image,
@@ -518,59 +588,111 @@ with open('/session/python_state.json', 'w') as f:
             network=network,
         )
         container.reload()
-        
-        # Get port info based on strategy
+        return container
+
+    def _repl_host_port(self, container) -> int:
+        """Port to reach the container's REPL on, based on the address strategy."""
         if self.address_strategy == "container":
-            host_port = 9000  # Container internal port
-        else:
-            host_port = int(container.attrs["NetworkSettings"]["Ports"][REPL_PORT][0]["HostPort"])
+            return 9000  # Container internal port
+        return int(container.attrs["NetworkSettings"]["Ports"][REPL_PORT][0]["HostPort"])
 
-        # Wait for /health quickly (best-effort)
-        # Register session first so we can use _get_repl_url
-        self.sessions[sid] = SessionInfo(container.id or "", host_port, sess_dir, self.session_storage)
-        
+    @staticmethod
+    def _wait_ready(base_url: str) -> None:
+        """Wait for the in-container REPL's /health quickly (best-effort)."""
         with httpx.Client(timeout=5.0) as http:
             for _ in range(50):  # ~5s worst case
                 try:
-                    base_url = self._get_repl_url(sid)
                     r = http.get(f"{base_url}/health")
                     if r.status_code == 200:
                         break
                 except Exception:
                     pass
                 time.sleep(0.1)
-        
-        # Create required directories in the container
+
+    @staticmethod
+    def _prepare_container_dirs(container) -> None:
+        """Create /to_export, /modified_data and /session/artifacts with open permissions."""
         try:
-            # Create /to_export, /modified_data, and /session/artifacts directories with proper permissions
             container.exec_run(["mkdir", "-p", "/to_export", "/modified_data", "/session/artifacts"], user="root")
             container.exec_run(["chmod", "777", "/to_export", "/modified_data", "/session/artifacts"], user="root")
         except Exception as e:
             print(f"Warning: Could not create directories: {e}")
-        
-        # Write initial session metadata (BIND mode only)
-        if self.session_storage == SessionStorage.BIND:
-            initial_metadata = {
-                "session_id": sid,
-                "created_at": datetime.now().isoformat(),
-                "container_id": container.id,
-                "host_port": host_port,
-                "session_storage": self.session_storage.value,
-                "dataset_access": self.dataset_access.value,
-                "image": self.image,
-                "execution_count": 0,
-                "last_used": datetime.now().isoformat()
-            }
-            self._write_session_metadata(sid, initial_metadata)
-            
-            # Log session start
-            self._write_session_log(sid, {
-                "event": "session_started",
-                "container_id": container.id,
-                "host_port": host_port
-            })
-        
-        return sid
+
+    def prewarm(self, count: int = 1) -> None:
+        """
+        Start `count` sandbox containers in the background, so that the next
+        start() calls adopt a ready container (renamed to sbox-<sid>) instead of
+        paying for `docker run` and the REPL health probe.
+
+        Only TMPFS session storage is supported: in BIND mode /session is bound
+        to the session's own host directory, which is unknown ahead of time.
+        Call it after cleanup_sandbox_containers(), which would remove the
+        pre-started containers (they are named sbox-warm-*), and call
+        shutdown_prewarmed() (or cleanup_all_containers()) on exit to remove
+        the ones no session adopted.
+        """
+        if count <= 0 or self.session_storage != SessionStorage.TMPFS:
+            return
+        if self._warm_executor is None:
+            self._warm_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sbox-warm")
+        for _ in range(count):
+            self._warm.append(self._warm_executor.submit(self._start_warm_container))
+
+    def _start_warm_container(self):
+        container = self._run_container(f"sbox-warm-{uuid.uuid4().hex[:8]}", None)
+        if self.address_strategy == "container":
+            base_url = f"http://{container.name}:9000"
+        else:
+            base_url = f"http://{self._detect_host_gateway()}:{self._repl_host_port(container)}"
+        self._wait_ready(base_url)
+        self._prepare_container_dirs(container)
+        return container
+
+    def _take_warm_container(self, name: str):
+        """Pop a pre-started container (waiting for it if still starting) and rename it to `name`."""
+        while self._warm:
+            try:
+                future = self._warm.popleft()
+            except IndexError:
+                break  # taken by a concurrent start()
+            try:
+                container = future.result()
+                container.rename(name)
+                container.reload()
+                return container
+            except Exception as e:
+                print(f"Warning: Could not use pre-started container: {e}")
+        return None
+
+    def shutdown_prewarmed(self) -> List[str]:
+        """
+        Remove pre-started containers no session has adopted and shut down the
+        prewarm executor. Containers still starting are waited for, then removed.
+
+        Returns:
+            Names of the removed containers
+        """
+        pending = []
+        while self._warm:
+            try:
+                pending.append(self._warm.popleft())
+            except IndexError:
+                break
+        if self._warm_executor is not None:
+            self._warm_executor.shutdown(wait=True, cancel_futures=True)
+            self._warm_executor = None
+
+        removed = []
+        for future in pending:
+            if future.cancelled():
+                continue
+            try:
+                container = future.result()
+                container.remove(force=True)
+                removed.append(container.name)
+            except Exception:
+                pass  # Best-effort
+        return removed
 
     def get_session_dir(self, session_key: str) -> Path:
         """
@@ -603,7 +725,15 @@ with open('/session/python_state.json', 'w') as f:
         info = self.sessions.get(session_key)
         if not info:
             raise RuntimeError("Unknown or expired session_key. Call start() first.")
-        return self.client.containers.get(info.container_id)
+        return self._container(info)
+
+    def _container(self, info: SessionInfo):
+        """
+        Return the Docker container handle for a session, looking it up only once.
+        """
+        if info.container is None:
+            info.container = self.client.containers.get(info.container_id)
+        return info.container
 
     def _list_artifact_files_host(self, session_dir: Path) -> set[str]:
         """
@@ -618,12 +748,12 @@ with open('/session/python_state.json', 'w') as f:
         if session_dir is None:
             return set()
         art = session_dir / "artifacts"
-        if not art.exists():
+        if not art.is_dir():
             return set()
+        root = str(session_dir)
         return {
-            str(p.relative_to(session_dir).as_posix())  # POSIX-style for container paths
-            for p in art.rglob("*")
-            if p.is_file()
+            os.path.relpath(entry.path, root).replace(os.sep, "/")  # POSIX-style for container paths
+            for entry in _scandir_files(str(art))
         }
 
     def _list_artifact_files_container(self, container) -> set[str]:
@@ -672,7 +802,8 @@ with open('/session/python_state.json', 'w') as f:
 
         def _extract_one(tar_bytes: bytes, want_name: str, out_path: Path) -> Path:
             bio = io.BytesIO(tar_bytes)
-            with tarfile.open(fileobj=bio, mode="r:*") as tar:
+            # Docker get_archive and `tar -cf -` both produce plain tars: skip compression probing
+            with tarfile.open(fileobj=bio, mode="r:") as tar:
                 # try exact name; else fallback to basename match
                 member = tar.getmember(want_name) if want_name in tar.getnames() else None
                 if member is None:
@@ -744,7 +875,7 @@ with open('/session/python_state.json', 'w') as f:
         if not info:
             return
 
-        container = self.client.containers.get(info.container_id)
+        container = self._container(info)
         
         # Targeted cleanup code - only clean what causes space issues
         cleanup_code = """
@@ -832,11 +963,20 @@ if session_artifacts.exists():
         # Mark as used (keep alive)
         info.last_used = time.time()
 
-        container = self.client.containers.get(info.container_id)
+        container = self._container(info)
 
         # Snapshot BEFORE
         if info.session_storage == SessionStorage.TMPFS:
-            before = self._list_artifact_files_container(container)
+            try:
+                before = self._list_artifact_files_container(container)
+            except errors.NotFound:
+                # The container disappeared behind our back (removed externally):
+                # forget the stale session and start a fresh container once.
+                self.sessions.pop(session_key, None)
+                self.start(session_key)
+                info = self.sessions[session_key]
+                container = self._container(info)
+                before = self._list_artifact_files_container(container)
         else:
             before = self._list_artifact_files_host(info.session_dir) if info.session_dir else set()
 
@@ -969,7 +1109,8 @@ if session_artifacts.exists():
         Returns:
             List of container names that were removed
         """
-        return cleanup_sandbox_containers(verbose=verbose)
+        removed = self.shutdown_prewarmed()
+        return removed + cleanup_sandbox_containers(verbose=verbose, client=self.client)
 
     def export_file(self, session_key: str, container_path: str) -> dict:
         """
@@ -1,16 +1,18 @@
 # langgraph_sandbox/tool_factory/make_tools.py
 from __future__ import annotations
 
-import json
-from typing import Callable, Optional, Awaitable, Any
+from typing import TYPE_CHECKING, Callable, Optional, Awaitable, Any
 
-from pydantic import BaseModel, Field, ConfigDict
+import orjson
+from pydantic import BaseModel, Field, ConfigDict, SkipValidation
 from typing_extensions import Annotated
 from langchain_core.tools import tool, InjectedToolCallId
-from langgraph.types import Command
-from langchain_core.messages import ToolMessage
+import asyncio
 import os
 
+if TYPE_CHECKING:
+    from langgraph.types import Command
+
 try:
     # Try relative imports first (when used as a module)
     from ..sandbox.session_manager import SessionManager
@@ -19,10 +21,64 @@ except ImportError:
     from sandbox.session_manager import SessionManager
 
 
+# Max number of artifacts listed line-by-line in the chat content (in_chat_url=True).
+# The full list is always available in the ToolMessage artifact field.
+MAX_CHAT_ARTIFACTS = 20
+
+
+def _format_artifacts(artifacts: list[dict]) -> str:
+    """
+    Human-readable artifact summary for the chat content (in_chat_url=True).
+
+    Expects the normalized descriptors built by the code sandbox tool
+    (name/mime/url/size always present). Lists at most MAX_CHAT_ARTIFACTS
+    entries; pieces are collected and joined once.
+    """
+    if not artifacts:
+        return ""
+    parts = ["\n\n📁 Generated Artifacts:\n"]
+    for artifact in artifacts[:MAX_CHAT_ARTIFACTS]:
+        parts.append(f"  • {artifact['name']} ({artifact['mime']}, {artifact['size']} bytes)\n")
+        if artifact["url"]:
+            parts.append(f"    Download: {artifact['url']}\n")
+    hidden = len(artifacts) - MAX_CHAT_ARTIFACTS
+    if hidden > 0:
+        parts.append(f"  ... and {hidden} more artifact(s), see the message artifacts\n")
+    parts.append("\n")
+    return "".join(parts)
+
+
 def _default_get_session_key() -> str:
     return "conv"  # TODO: user/thread id
 
 
+# Tool argument schemas live at module scope so Pydantic builds each core
+# schema once per process instead of once per factory call.
+# `tool_call_id` is injected by LangChain from the ToolCall (never by the model),
+# so SkipValidation passes it through as-is; model-provided fields are validated.
+class ExecuteCodeArgs(BaseModel):
+    code: str = Field(description="Python code to execute in the sandbox.")
+    tool_call_id: Annotated[str, InjectedToolCallId, SkipValidation]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class SelectDatasetArgs(BaseModel):
+    dataset_id: Annotated[str, Field(description="The dataset ID")]
+    tool_call_id: Annotated[str, InjectedToolCallId, SkipValidation]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class ExportDatasetArgs(BaseModel):
+    container_path: Annotated[str, Field(description="Path to file inside container (e.g., '/to_export/<name>.parquet')")]
+    tool_call_id: Annotated[str, InjectedToolCallId, SkipValidation]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class ListDatasetsArgs(BaseModel):
+    tool_call_id: Annotated[str, InjectedToolCallId, SkipValidation]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 def make_code_sandbox_tool(
     *,
     session_manager: SessionManager,
@@ -47,10 +103,9 @@ def make_code_sandbox_tool(
         )
     """
 
-    class ExecuteCodeArgs(BaseModel):
-        code: str = Field(description="Python code to execute in the sandbox.")
-        tool_call_id: Annotated[str, InjectedToolCallId]
-        model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Deferred so importing this module doesn't pull in langgraph's graph machinery
+    from langgraph.types import Command
+    from langchain_core.messages import ToolMessage
 
     # The implementation closes over session_manager, session_key_fn
     async def _impl(
@@ -68,49 +123,43 @@ def make_code_sandbox_tool(
         sid = session_key_fn()
         session_manager.start(sid)
 
-        # Execute code - no dataset loading here anymore
-        result = session_manager.exec(sid, code, timeout=timeout_s)
+        # Execute code - no dataset loading here anymore.
+        # exec blocks on the container for up to timeout_s: run it in a worker
+        # thread so other tool calls on the event loop keep making progress.
+        result = await asyncio.to_thread(session_manager.exec, sid, code, timeout=timeout_s)
+
+        # Read each stream once; `or ""` also covers keys present with a None value
+        stdout = result.get("stdout") or ""
+        stderr = result.get("error") or result.get("stderr") or ""
 
         payload = {
-            "stdout": result.get("stdout", ""),
-            "stderr": result.get("error", "") or result.get("stderr", ""),
+            "stdout": stdout,
+            "stderr": stderr,
             "session_dir": result.get("session_dir", ""),
         }
 
         artifacts = result.get("artifacts", [])
 
         # Create structured artifact information for the UI. ALways include it in artifacts to be retrieved in main 
-        structured_artifacts = []
-        if artifacts:
-            for artifact in artifacts:
-                artifact_data = {
-                    "name": artifact.get('name', 'unknown'),
-                    "mime": artifact.get('mime', 'unknown'),
-                    "url": artifact.get('url', ''),
-                    "size": artifact.get('size', 0)
-                }
-                structured_artifacts.append(artifact_data)
+        structured_artifacts = [
+            {
+                "name": artifact.get('name', 'unknown'),
+                "mime": artifact.get('mime', 'unknown'),
+                "url": artifact.get('url', ''),
+                "size": artifact.get('size', 0)
+            }
+            for artifact in artifacts
+        ]
+
+        payload_json = orjson.dumps(payload).decode()
 
         # IF configs specify it (in_chat_url=True), also include the artifact information in the content for the agent
         if cfg.in_chat_url:
-        # Create human-readable artifact summary for content
-            artifact_summary = ""
-            if artifacts:
-                artifact_summary = "\n\n📁 Generated Artifacts:\n"
-                for artifact in artifacts:
-                    filename = artifact.get('name', 'unknown')
-                    size = artifact.get('size', 0)
-                    mime = artifact.get('mime', 'unknown')
-                    download_url = artifact.get('url', '')
-                    artifact_summary += f"  • {filename} ({mime}, {size} bytes)\n"
-                    if download_url:
-                        artifact_summary += f"    Download: {download_url}\n"
-                artifact_summary += "\n"        
             # Combine stdout with artifact information
-            content = result.get("stdout", "") + artifact_summary + json.dumps(payload, ensure_ascii=False, indent=2)
+            content = "".join((stdout, _format_artifacts(structured_artifacts), payload_json))
         else:
             # ELSE, only include it in artifacts to be retrieved in main (in_chat_url=False)
-            content = json.dumps(payload, ensure_ascii=False, indent=2)
+            content = payload_json
 
         # Only include artifact parameter if there are actually artifacts
         if len(structured_artifacts) > 0:
@@ -161,12 +210,10 @@ def make_select_dataset_tool(
     Returns:
         LangChain tool function
     """
-    
-    class SelectDatasetArgs(BaseModel):
-        dataset_id: Annotated[str, Field(description="The dataset ID")]
-        tool_call_id: Annotated[str, InjectedToolCallId]
-        model_config = ConfigDict(arbitrary_types_allowed=True)
-    
+
+    from langgraph.types import Command
+    from langchain_core.messages import ToolMessage
+
     async def _impl(
         dataset_id: Annotated[str, "The dataset ID"], 
         tool_call_id: Annotated[str, InjectedToolCallId]
@@ -284,12 +331,10 @@ def make_export_datasets_tool(
     Returns:
         LangChain tool function
     """
-    
-    class ExportDatasetArgs(BaseModel):
-        container_path: Annotated[str, Field(description="Path to file inside container (e.g., '/to_export/<name>.parquet')")]
-        tool_call_id: Annotated[str, InjectedToolCallId]
-        model_config = ConfigDict(arbitrary_types_allowed=True)
-    
+
+    from langgraph.types import Command
+    from langchain_core.messages import ToolMessage
+
     async def _impl(
         container_path: Annotated[str, "Path to file inside container in the to_export/ directory (e.g., '/to_export/<name>.parquet')"], 
         tool_call_id: Annotated[str, InjectedToolCallId]
@@ -357,57 +402,44 @@ def make_list_datasets_tool(
     Returns:
         LangChain tool function
     """
-    
-    class ListDatasetsArgs(BaseModel):
-        tool_call_id: Annotated[str, InjectedToolCallId]
-        model_config = ConfigDict(arbitrary_types_allowed=True)
-    
-    async def _impl(
-        tool_call_id: Annotated[str, InjectedToolCallId]
-    ) -> Command:
-        """List all datasets in the sandbox."""
-        try:
-            from ..config import Config, DatasetAccess
-        except ImportError:
-            from config import Config, DatasetAccess
-        
-        # Load configuration to determine dataset access mode
-        cfg = Config.from_env()
-        session_key = session_key_fn()
-        
-        # Start the session if not already started
-        session_manager.start(session_key)
-        
-        # Determine the path to list based on dataset access mode
-        if cfg.dataset_access == DatasetAccess.API:
-            # API mode: list files in /data
-            list_path = "/data"
-            mode_description = "API mode (loaded datasets)"
-        elif cfg.dataset_access == DatasetAccess.LOCAL_RO:
-            # LOCAL_RO mode: list files in /data
-            list_path = "/data"
-            mode_description = "LOCAL_RO mode (statically mounted files)"
-        elif cfg.dataset_access == DatasetAccess.HYBRID:
-            # HYBRID mode: list files in both /data (API) and /heavy_data (local)
-            list_path = "/data"
-            mode_description = "HYBRID mode (local + API datasets)"
-        else:
-            # NONE mode: no datasets available
-            return Command(
-                update={
-                    "messages": [
-                        ToolMessage(
-                            content="No datasets available - sandbox is in NONE mode",
-                            tool_call_id=tool_call_id,
-                        )
-                    ]
-                }
-            )
-        
-        # Execute code to list files in the appropriate directory
-        if cfg.dataset_access == DatasetAccess.HYBRID:
-            # HYBRID mode: list both /data and /heavy_data
-            list_code = f"""
+
+    from langgraph.types import Command
+    from langchain_core.messages import ToolMessage
+
+    try:
+        from ..config import DatasetAccess
+    except ImportError:
+        from config import DatasetAccess
+
+    # The dataset access mode is fixed for the lifetime of the session manager, so
+    # resolve the listing path and snippet once here instead of on every call.
+    try:
+        dataset_access = DatasetAccess(getattr(session_manager, "dataset_access", DatasetAccess.NONE))
+    except ValueError:
+        dataset_access = DatasetAccess.NONE
+
+    # Determine the path to list based on dataset access mode
+    if dataset_access == DatasetAccess.API:
+        # API mode: list files in /data
+        list_path = "/data"
+        mode_description = "API mode (loaded datasets)"
+    elif dataset_access == DatasetAccess.LOCAL_RO:
+        # LOCAL_RO mode: list files in /data
+        list_path = "/data"
+        mode_description = "LOCAL_RO mode (statically mounted files)"
+    elif dataset_access == DatasetAccess.HYBRID:
+        # HYBRID mode: list files in both /data (API) and /heavy_data (local)
+        list_path = "/data"
+        mode_description = "HYBRID mode (local + API datasets)"
+    else:
+        # NONE mode: no datasets available
+        list_path = None
+        mode_description = None
+
+    # Code to list files in the appropriate directory
+    if dataset_access == DatasetAccess.HYBRID:
+        # HYBRID mode: list both /data and /heavy_data
+        list_code = f"""
 import os
 import json
 from pathlib import Path
@@ -451,11 +483,11 @@ result = {{
     "count": len(files)
 }}
 
-print(json.dumps(result, indent=2))
+print(json.dumps(result))
 """
-        else:
-            # Other modes: list single directory
-            list_code = f"""
+    elif list_path is not None:
+        # Other modes: list single directory
+        list_code = f"""
 import os
 import json
 from pathlib import Path
@@ -490,11 +522,35 @@ result = {{
     "count": len([f for f in files if not f.get("type") == "directory"])
 }}
 
-print(json.dumps(result, indent=2))
+print(json.dumps(result))
 """
-        
-        # Execute the listing code
-        result = session_manager.exec(session_key, list_code, timeout=10)
+    else:
+        list_code = None
+
+    async def _impl(
+        tool_call_id: Annotated[str, InjectedToolCallId]
+    ) -> Command:
+        """List all datasets in the sandbox."""
+        if list_code is None:
+            # NONE mode: no datasets available
+            return Command(
+                update={
+                    "messages": [
+                        ToolMessage(
+                            content="No datasets available - sandbox is in NONE mode",
+                            tool_call_id=tool_call_id,
+                        )
+                    ]
+                }
+            )
+
+        session_key = session_key_fn()
+
+        # Start the session if not already started
+        session_manager.start(session_key)
+
+        # Execute the listing code (blocking call, off the event loop)
+        result = await asyncio.to_thread(session_manager.exec, session_key, list_code, timeout=10)
         
         if result.get("error"):
             content = f"Error listing datasets: {result['error']}"
@@ -502,9 +558,9 @@ print(json.dumps(result, indent=2))
             stdout = result.get("stdout", "")
             # Parse the JSON output
             try:
-                result_data = json.loads(stdout)
-                content = f"Datasets in {mode_description}:\n\n{json.dumps(result_data, indent=2)}"
-            except json.JSONDecodeError as e:
+                result_data = orjson.loads(stdout)
+                content = f"Datasets in {mode_description}:\n\n{orjson.dumps(result_data).decode()}"
+            except orjson.JSONDecodeError as e:
                 content = f"Error parsing JSON output: {e}\nRaw output: {stdout}"
         
         return Command(
@@ -0,0 +1,20 @@
+# tests/conftest.py
+import os
+import sys
+from pathlib import Path
+
+# Make the project root importable once for the whole suite
+# (langgraph_sandbox/ lives next to tests/)
+ROOT = str(Path(__file__).resolve().parents[1])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def pytest_configure(config):
+    # Tests write lots of tiny files (sessions, blobstore, sqlite); keep pytest's
+    # temp root on tmpfs when available. Only the root moves: pytest still makes
+    # numbered per-run directories under it (pytest-of-<user>/pytest-N), so
+    # concurrent runs don't clash and recent runs stay inspectable. An explicit
+    # --basetemp or PYTEST_DEBUG_TEMPROOT still wins.
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
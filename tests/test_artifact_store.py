@@ -0,0 +1,259 @@
+import hashlib
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from langgraph_sandbox.artifacts import api, ingest, reader
+from langgraph_sandbox.artifacts import store as store_module
+from langgraph_sandbox.artifacts.server import _GZipTextMiddleware
+from langgraph_sandbox.artifacts.ingest import INLINE_MAX_BYTES, _file_sha256, ingest_files
+from langgraph_sandbox.artifacts.store import _connect, ensure_artifact_store
+from langgraph_sandbox.artifacts.tokens import create_token
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTIFACTS_DB_PATH", str(tmp_path / "artifacts.db"))
+    monkeypatch.setenv("BLOBSTORE_DIR", str(tmp_path / "blobstore"))
+    monkeypatch.setenv("ARTIFACTS_SECRET", "test-secret")
+    info = ensure_artifact_store()
+    return Path(info["blobstore_dir"])
+
+
+def test_store_uses_wal_and_fast_pragmas(tmp_path):
+    info = ensure_artifact_store(
+        custom_db_path=str(tmp_path / "artifacts.db"),
+        custom_blob_dir=str(tmp_path / "blobstore"),
+    )
+    assert Path(info["blobstore_dir"]).is_dir()
+
+    conn = _connect(Path(info["db_path"]))
+    try:
+        assert conn.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous;").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA temp_store;").fetchone()[0] == 2   # MEMORY
+        assert conn.execute("PRAGMA foreign_keys;").fetchone()[0] == 1
+    finally:
+        conn.close()
+
+
+def test_file_sha256_matches_hashlib(tmp_path):
+    data = b"x" * (3 * 1024 * 1024 + 7)
+    p = tmp_path / "blob.bin"
+    p.write_bytes(data)
+    assert _file_sha256(p) == hashlib.sha256(data).hexdigest()
+
+
+def test_small_artifacts_are_stored_inline(tmp_path, store):
+    small = tmp_path / "note.txt"
+    small.write_bytes(b"hello artifact")
+    big = tmp_path / "big.bin"
+    big.write_bytes(b"y" * (INLINE_MAX_BYTES + 1))
+
+    small_desc, big_desc = ingest_files([small, big], session_id="s1")
+
+    # Only the large file lands in the blobstore
+    blobs = [p for p in store.rglob("*") if p.is_file()]
+    assert [p.name for p in blobs] == [big_desc["sha256"]]
+
+    assert reader.read_bytes(small_desc["id"]) == b"hello artifact"
+    assert reader.read_text(small_desc["id"]) == "hello artifact"
+    assert reader.read_bytes(big_desc["id"]) == b"y" * (INLINE_MAX_BYTES + 1)
+
+    app = FastAPI()
+    app.include_router(api.router)
+    client = TestClient(app)
+    for desc, body in ((small_desc, b"hello artifact"), (big_desc, b"y" * (INLINE_MAX_BYTES + 1))):
+        r = client.get(f"/artifacts/{desc['id']}", params={"token": create_token(desc["id"])})
+        assert r.status_code == 200
+        assert r.content == body
+        assert desc["name"] in r.headers["content-disposition"]
+
+    # Blobs are streamed by FileResponse, which also honours Range requests
+    r = client.get(
+        f"/artifacts/{big_desc['id']}",
+        params={"token": create_token(big_desc["id"])},
+        headers={"Range": "bytes=0-9"},
+    )
+    assert r.status_code == 206
+    assert r.content == b"y" * 10
+
+    # Requests served by the same thread reuse one connection, shared with the reader
+    assert api._db() is api._db() is reader._db()
+
+
+def test_text_artifacts_are_gzipped_binary_ones_are_not(tmp_path, store):
+    csv = tmp_path / "table.csv"
+    csv.write_bytes(b"a,b,c\n" + b"1,2,3\n" * 20_000)  # streamed from the blobstore
+    png = tmp_path / "plot.png"
+    png.write_bytes(b"\x89PNG" + b"\0" * 4096)
+    csv_desc, png_desc = ingest_files([csv, png], session_id="s1")
+
+    app = FastAPI()
+    app.include_router(api.router)
+    client = TestClient(_GZipTextMiddleware(app))
+
+    r = client.get(f"/artifacts/{csv_desc['id']}", params={"token": create_token(csv_desc["id"])})
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.content == b"a,b,c\n" + b"1,2,3\n" * 20_000  # httpx decodes it
+    assert "accept-ranges" not in r.headers
+    assert r.headers["etag"].startswith('W/"')
+
+    r = client.get(f"/artifacts/{png_desc['id']}", params={"token": create_token(png_desc["id"])})
+    assert "content-encoding" not in r.headers
+    assert r.headers["content-length"] == str(4100)
+
+    r = client.get(
+        f"/artifacts/{csv_desc['id']}",
+        params={"token": create_token(csv_desc["id"])},
+        headers={"Range": "bytes=0-5"},
+    )
+    assert r.status_code == 206 and "content-encoding" not in r.headers
+    assert r.content == b"a,b,c\n"
+
+
+def test_thread_connection_is_reopened_when_db_is_recreated(tmp_path, store):
+    conn = reader._db()
+    assert reader._db() is conn
+
+    db_path = Path(reader._resolve_paths()["db_path"])
+    for p in db_path.parent.glob(db_path.name + "*"):  # db, -wal, -shm
+        p.unlink()
+    ensure_artifact_store()
+
+    fresh = reader._db()
+    assert fresh is not conn
+    assert fresh.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] == 0
+
+
+def test_schema_migration_adds_inline_column(tmp_path):
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE artifacts (id TEXT PRIMARY KEY, sha256 TEXT NOT NULL UNIQUE, "
+            "size INTEGER NOT NULL, mime TEXT NOT NULL, filename TEXT, created_at TEXT NOT NULL)"
+        )
+    ensure_artifact_store(custom_db_path=str(db_path), custom_blob_dir=str(tmp_path / "blobs"))
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(artifacts)")}
+    assert "data" in columns
+
+
+def test_ingest_recreates_pruned_shard_dir(tmp_path, store):
+    first = tmp_path / "a.bin"
+    first.write_bytes(b"a" * (INLINE_MAX_BYTES + 1))
+    (desc,) = ingest_files([first], session_id="s1")
+    shutil.rmtree(store)  # prune the whole blobstore, the shard cache is now stale
+
+    again = tmp_path / "a2.bin"
+    again.write_bytes(b"a" * (INLINE_MAX_BYTES + 1))
+    (desc2,) = ingest_files([again], session_id="s1")
+    assert desc2["id"] == desc["id"]
+    assert reader.read_bytes(desc["id"]) == b"a" * (INLINE_MAX_BYTES + 1)
+
+
+def test_ingest_moves_staged_file_into_blobstore(tmp_path, store):
+    staged = tmp_path / "big.bin"
+    staged.write_bytes(b"z" * (INLINE_MAX_BYTES + 1))
+    inode = staged.stat().st_ino
+
+    (desc,) = ingest_files([staged], session_id="s1")
+
+    assert not staged.exists()
+    blob = store / desc["sha256"][:2] / desc["sha256"]
+    assert blob.stat().st_ino == inode  # renamed, not copied
+
+    # Duplicate content: the staged copy is just removed
+    dup = tmp_path / "dup.bin"
+    dup.write_bytes(b"z" * (INLINE_MAX_BYTES + 1))
+    (desc2,) = ingest_files([dup], session_id="s2")
+    assert desc2["id"] == desc["id"]
+    assert not dup.exists()
+    assert blob.stat().st_ino == inode
+
+
+def _trace_statements(monkeypatch):
+    """Record the SQL run on connections opened by ingest."""
+    statements = []
+
+    def traced_connect(db_path):
+        conn = _connect(db_path)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(ingest, "_connect", traced_connect)
+    return statements
+
+
+def test_ingest_batch_shares_one_transaction(tmp_path, store, monkeypatch):
+    files = []
+    for i in range(3):
+        f = tmp_path / f"f{i}.txt"
+        f.write_text(f"content {i % 2}")  # f0 and f2 are duplicates
+        files.append(f)
+
+    statements = _trace_statements(monkeypatch)
+    descs = ingest_files(files, session_id="s1", run_id="r1")
+    assert statements.count("COMMIT") == 1
+
+    assert descs[0]["id"] == descs[2]["id"] != descs[1]["id"]
+    assert not any(f.exists() for f in files)
+    with sqlite3.connect(reader._resolve_paths()["db_path"]) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM links WHERE session_id='s1'").fetchone()[0] == 3
+
+    # The per-session listing is served from the covering links index
+    urls = reader.fetch_artifact_urls("s1")
+    assert len(urls) == 3 and {u["id"] for u in urls} == {d["id"] for d in descs}
+    with sqlite3.connect(reader._resolve_paths()["db_path"]) as conn:
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT a.id FROM artifacts a JOIN links l ON a.id = l.artifact_id "
+            "WHERE l.session_id = ? ORDER BY a.created_at DESC", ("s1",)
+        ))
+    assert "COVERING INDEX idx_links_session_artifact" in plan
+
+
+def test_failed_batch_leaves_staged_files_in_place(tmp_path, store, monkeypatch):
+    big = tmp_path / "big.bin"
+    big.write_bytes(b"b" * (INLINE_MAX_BYTES + 1))
+    small = tmp_path / "small.txt"
+    small.write_text("small")
+
+    def fail_on_second(path):
+        if path.name == "small.txt":
+            raise OSError("boom")
+        return "application/octet-stream"
+
+    monkeypatch.setattr(ingest, "_sniff_mime", fail_on_second)
+    with pytest.raises(OSError):
+        ingest_files([big, small], session_id="s1")
+
+    # Rolled back, and the large file was not moved into the blobstore
+    assert big.read_bytes() == b"b" * (INLINE_MAX_BYTES + 1) and small.exists()
+    assert not [p for p in store.rglob("*") if p.is_file()]
+    with sqlite3.connect(reader._resolve_paths()["db_path"]) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] == 0
+
+
+def test_old_two_level_blob_layout_is_migrated(tmp_path, monkeypatch):
+    blob_dir = tmp_path / "blobstore"
+    sha = hashlib.sha256(b"old").hexdigest()
+    old = blob_dir / sha[:2] / sha[2:4] / sha
+    old.parent.mkdir(parents=True)
+    old.write_bytes(b"old")
+
+    for _ in range(2):  # idempotent
+        ensure_artifact_store(custom_db_path=str(tmp_path / "a.db"), custom_blob_dir=str(blob_dir))
+
+    assert (blob_dir / sha[:2] / sha).read_bytes() == b"old"
+    assert not old.parent.exists()
+
+    # Recorded in the database: later calls no longer walk the blobstore
+    walks = []
+    monkeypatch.setattr(store_module, "_migrate_blob_layout", walks.append)
+    ensure_artifact_store(custom_db_path=str(tmp_path / "a.db"), custom_blob_dir=str(blob_dir))
+    assert walks == []
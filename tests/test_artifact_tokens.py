@@ -0,0 +1,69 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from langgraph_sandbox.artifacts import tokens
+from langgraph_sandbox.artifacts.tokens import create_download_urls, create_token, verify_token
+
+
+def test_token_roundtrip_with_env_secret(monkeypatch):
+    monkeypatch.setenv("ARTIFACTS_SECRET", "test-secret")
+    token = create_token("art_abc")
+    assert verify_token(token)["artifact_id"] == "art_abc"
+
+    # A token signed with another secret is rejected
+    monkeypatch.setenv("ARTIFACTS_SECRET", "other-secret")
+    with pytest.raises(RuntimeError, match="signature"):
+        verify_token(token)
+
+
+def test_token_roundtrip_without_env_secret(monkeypatch):
+    # The generated development secret must stay stable within the process
+    monkeypatch.delenv("ARTIFACTS_SECRET", raising=False)
+    token = create_token("art_abc")
+    assert verify_token(token)["artifact_id"] == "art_abc"
+
+    # ... even after other secrets have been used, and for an empty secret
+    for i in range(8):
+        monkeypatch.setenv("ARTIFACTS_SECRET", f"secret-{i}")
+        create_token("art_abc")
+    monkeypatch.setenv("ARTIFACTS_SECRET", "")
+    assert verify_token(token)["artifact_id"] == "art_abc"
+
+
+def test_signature_check_is_cached_per_secret(monkeypatch):
+    monkeypatch.setenv("ARTIFACTS_SECRET", "test-secret")
+    token = create_token("art_abc")
+    verify_token(token)
+    hits = tokens._verify_signed.cache_info().hits
+    assert verify_token(token)["artifact_id"] == "art_abc"
+    assert tokens._verify_signed.cache_info().hits == hits + 1
+
+    # Expiry is still checked on cache hits
+    monkeypatch.setattr(tokens.time, "time", lambda: 10**12)
+    with pytest.raises(RuntimeError, match="expired"):
+        verify_token(token)
+
+
+def test_expired_token_is_rejected(monkeypatch):
+    monkeypatch.setenv("ARTIFACTS_SECRET", "test-secret")
+    token = create_token("art_abc", now=0)
+    with pytest.raises(RuntimeError, match="expired"):
+        verify_token(token)
+
+
+@pytest.mark.parametrize("token", ["", "no-dot", "a.b.c", ".sig", "msg.", "!!!.???", "YXJ0X2FiYw.c2ln"])
+def test_malformed_tokens_are_rejected(monkeypatch, token):
+    monkeypatch.setenv("ARTIFACTS_SECRET", "test-secret")
+    with pytest.raises(RuntimeError, match="Invalid token"):
+        verify_token(token)
+
+
+def test_download_urls_batch(monkeypatch):
+    monkeypatch.setenv("ARTIFACTS_SECRET", "test-secret")
+    monkeypatch.setenv("ARTIFACTS_PUBLIC_BASE_URL", "https://example.test/")
+    urls = create_download_urls(["art_a", "art_b"])
+    for aid, url in zip(["art_a", "art_b"], urls):
+        parts = urlsplit(url)
+        assert f"{parts.scheme}://{parts.netloc}{parts.path}" == f"https://example.test/artifacts/{aid}"
+        assert verify_token(parse_qs(parts.query)["token"][0])["artifact_id"] == aid
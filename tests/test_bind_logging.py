@@ -3,17 +3,29 @@
 Test script to demonstrate the new BIND mode session logging functionality.
 """
 
+import os
 import sys
 from pathlib import Path
 
-# Add project root to path so we can import our modules
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+# Under pytest the project root is put on sys.path by tests/conftest.py;
+# only do it here when this file is run directly as a script
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from langgraph_sandbox.sandbox.session_manager import SessionManager, SessionStorage, DatasetAccess
 
 
+def _walk_scandir(root: Path, _base: Path | None = None):
+    """Yield (relative path, size) for files under root; DirEntry.stat() avoids extra syscalls."""
+    base = _base or root
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_scandir(Path(entry.path), base)
+            elif entry.is_file(follow_symlinks=False):
+                yield Path(entry.path).relative_to(base), entry.stat(follow_symlinks=False).st_size
+
+
 def demo_bind_logging():
     """Test the new BIND mode logging functionality."""
     print("Testing BIND mode session logging...")
@@ -94,10 +106,8 @@ print("Data summary saved!")
         
         # Check what files were created
         print("\nFiles created:")
-        for file_path in session_dir.rglob("*"):
-            if file_path.is_file():
-                size = file_path.stat().st_size
-                print(f"  {file_path.relative_to(session_dir)} ({size} bytes)")
+        for rel_path, size in _walk_scandir(session_dir):
+            print(f"  {rel_path} ({size} bytes)")
         
         print("\n" + "="*50)
         print("Use the session viewer to inspect the logs:")
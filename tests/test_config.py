@@ -1,16 +1,11 @@
 # tests/test_config.py
 import os
-import sys
-from pathlib import Path
+import re
 
 import pytest
 
-# Ensure project root is importable (langgraph_sandbox/__init__.py exists)
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from langgraph_sandbox.config import Config, SessionStorage, DatasetAccess  # noqa: E402
+# The project root is put on sys.path once, in tests/conftest.py
+from langgraph_sandbox.config import Config, SessionStorage, DatasetAccess
 
 
 ENV_KEYS = [
@@ -25,6 +20,8 @@ ENV_KEYS = [
     "TMPFS_SIZE_MB",
 ]
 
+_HYBRID_PATH_ERR = re.compile(r"HYBRID_LOCAL_PATH is required when DATASET_ACCESS=HYBRID")
+
 
 def _clear_env(monkeypatch):
     for k in ENV_KEYS:
@@ -59,7 +56,7 @@ def test_hybrid_requires_hybrid_path(monkeypatch, tmp_path):
     # Create a temporary env file with HYBRID but no HYBRID_LOCAL_PATH
     env_file = tmp_path / "test.env"
     env_file.write_text("DATASET_ACCESS=HYBRID\n")
-    with pytest.raises(ValueError, match="HYBRID_LOCAL_PATH is required when DATASET_ACCESS=HYBRID"):
+    with pytest.raises(ValueError, match=_HYBRID_PATH_ERR):
         Config.from_env(env_file_path=env_file)
 
 
@@ -149,3 +146,21 @@ def test_unified_data_path():
     c = Config.from_env()
     assert c.container_data_staged == "/data"
     assert c.container_data_ro == "/data"
+
+
+def test_from_env_is_memoized_per_snapshot(monkeypatch, tmp_path):
+    _clear_env(monkeypatch)
+    monkeypatch.chdir(tmp_path)
+    env_file = tmp_path / "test.env"
+    env_file.write_text("TMPFS_SIZE_MB=2048\n")
+
+    a = Config.from_env(env_file_path=env_file)
+    assert Config.from_env(env_file_path=env_file) is a
+
+    # Changing a relevant variable or the env file yields a fresh Config
+    monkeypatch.setenv("SANDBOX_IMAGE", "other:latest")
+    b = Config.from_env(env_file_path=env_file)
+    assert b is not a and b.sandbox_image == "other:latest"
+
+    env_file.write_text("TMPFS_SIZE_MB=4096\n")
+    assert Config.from_env(env_file_path=env_file).tmpfs_size_mb == 4096
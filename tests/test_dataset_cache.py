@@ -0,0 +1,68 @@
+import pytest
+
+from langgraph_sandbox.config import Config
+from langgraph_sandbox.dataset_manager import cache
+from langgraph_sandbox.dataset_manager.cache import (
+    DatasetStatus,
+    add_entry,
+    clear_cache,
+    read_ids,
+    read_pending_ids,
+    update_entry_status,
+)
+
+
+@pytest.fixture(scope="module")
+def cfg(tmp_path_factory) -> Config:
+    # One sessions root for the module; each test uses its own session id
+    return Config(sessions_root=tmp_path_factory.mktemp("dataset_cache") / "sessions")
+
+
+def test_read_is_memoized_until_file_changes(cfg, monkeypatch):
+    sid = "memo"
+    add_entry(cfg, sid, "ds_a")
+    assert read_pending_ids(cfg, sid) == ["ds_a"]
+
+    # A second read with an unchanged file must not parse JSON again
+    def boom(*args, **kwargs):
+        raise AssertionError("cache file was re-parsed")
+
+    monkeypatch.setattr(cache.json, "load", boom)
+    assert read_ids(cfg, sid) == ["ds_a"]
+    assert read_pending_ids(cfg, sid) == ["ds_a"]
+
+
+def test_writes_invalidate_memoized_entries(cfg):
+    sid = "invalidate"
+    add_entry(cfg, sid, "ds_a")
+    add_entry(cfg, sid, "ds_b")
+    assert read_pending_ids(cfg, sid) == ["ds_a", "ds_b"]
+
+    update_entry_status(cfg, sid, "ds_a", DatasetStatus.LOADED)
+    assert read_pending_ids(cfg, sid) == ["ds_b"]
+    assert read_ids(cfg, sid) == ["ds_a", "ds_b"]
+
+    clear_cache(cfg, sid)
+    assert read_ids(cfg, sid) == []
+
+
+def test_missing_file_reads_empty(cfg):
+    sid = "missing"
+    add_entry(cfg, sid, "ds_a")
+    cache.cache_file_path(cfg, sid).unlink()
+    assert read_ids(cfg, sid) == []
+
+
+def test_writes_refresh_memo_without_reparsing(cfg, monkeypatch):
+    sid = "write_through"
+    add_entry(cfg, sid, "ds_a")
+
+    def boom(*args, **kwargs):
+        raise AssertionError("cache file was re-parsed")
+
+    # Each write memoizes its own output: the read-modify-write cycle never parses
+    monkeypatch.setattr(cache.json, "load", boom)
+    add_entry(cfg, sid, "ds_b")
+    update_entry_status(cfg, sid, "ds_a", DatasetStatus.LOADED)
+    assert read_ids(cfg, sid) == ["ds_a", "ds_b"]
+    assert read_pending_ids(cfg, sid) == ["ds_b"]
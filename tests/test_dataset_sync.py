@@ -0,0 +1,117 @@
+import asyncio
+import io
+import tarfile
+from unittest.mock import Mock
+
+import pytest
+
+from langgraph_sandbox.config import Config, DatasetAccess
+from langgraph_sandbox.dataset_manager import cache, staging
+from langgraph_sandbox.dataset_manager.cache import add_entry, read_pending_ids
+from langgraph_sandbox.dataset_manager.sync import load_pending_datasets
+
+
+def _container():
+    container = Mock()
+    container.exec_run.return_value = (0, b"")
+    return container
+
+
+def _run(cfg, container, fetch_fn, ds_ids):
+    return asyncio.run(
+        load_pending_datasets(
+            cfg=cfg,
+            session_id="s1",
+            container=container,
+            fetch_fn=fetch_fn,
+            ds_ids=ds_ids,
+        )
+    )
+
+
+def test_api_tmpfs_stages_all_datasets_in_one_archive(tmp_path):
+    cfg = Config(sessions_root=tmp_path / "sessions")
+    for ds_id in ("ds_a", "ds_b", "ds_c"):
+        add_entry(cfg, "s1", ds_id)
+
+    async def fetch(ds_id: str) -> bytes:
+        return ds_id.encode()
+
+    container = _container()
+    out = _run(cfg, container, fetch, ["ds_a", "ds_b", "ds_c"])
+
+    assert [d["id"] for d in out] == ["ds_a", "ds_b", "ds_c"]
+    assert out[0]["path_in_container"] == "/data/ds_a.parquet"
+
+    # One Docker round-trip for the whole batch
+    container.put_archive.assert_called_once()
+    kwargs = container.put_archive.call_args.kwargs
+    assert kwargs["path"] == "/data"
+    with tarfile.open(fileobj=io.BytesIO(kwargs["data"]), mode="r:") as tar:
+        assert tar.getnames() == ["ds_a.parquet", "ds_b.parquet", "ds_c.parquet"]
+        assert tar.extractfile("ds_b.parquet").read() == b"ds_b"
+
+    assert read_pending_ids(cfg, "s1") == []
+
+
+def test_api_datasets_are_fetched_concurrently(tmp_path):
+    cfg = Config(sessions_root=tmp_path / "sessions")
+    ds_ids = [f"ds_{i}" for i in range(12)]
+    for ds_id in ds_ids:
+        add_entry(cfg, "s1", ds_id)
+
+    in_flight = peak = 0
+
+    async def fetch(ds_id: str) -> bytes:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return ds_id.encode()
+
+    out = _run(cfg, _container(), fetch, ds_ids)
+
+    assert [d["id"] for d in out] == ds_ids
+    assert peak == staging.MAX_CONCURRENT_FETCHES
+
+
+def test_api_fetch_failure_marks_batch_failed(tmp_path):
+    cfg = Config(sessions_root=tmp_path / "sessions")
+    add_entry(cfg, "s1", "ds_a")
+    add_entry(cfg, "s1", "ds_b")
+
+    async def fetch(ds_id: str) -> bytes:
+        raise RuntimeError("boom")
+
+    container = _container()
+    with pytest.raises(Exception, match="boom"):
+        _run(cfg, container, fetch, ["ds_a", "ds_b"])
+
+    container.put_archive.assert_not_called()
+    assert read_pending_ids(cfg, "s1") == []
+
+
+def test_statuses_are_written_once_per_load(tmp_path, monkeypatch):
+    cfg = Config(
+        dataset_access=DatasetAccess.LOCAL_RO,
+        datasets_host_ro=tmp_path / "datasets",
+        sessions_root=tmp_path / "sessions",
+    )
+    for ds_id in ("ds_a", "ds_b", "ds_c"):
+        add_entry(cfg, "s1", ds_id)
+
+    writes = []
+    real_write = cache._write_cache_data
+
+    def counting_write(*args):
+        writes.append(args)
+        return real_write(*args)
+
+    monkeypatch.setattr(cache, "_write_cache_data", counting_write)
+
+    out = _run(cfg, _container(), None, ["ds_a", "ds_b", "ds_c"])
+
+    assert [d["id"] for d in out] == ["ds_a", "ds_b", "ds_c"]
+    assert len(writes) == 1
+    assert read_pending_ids(cfg, "s1") == []
@@ -5,10 +5,9 @@ Tests configuration, SessionManager, and tool factory integration.
 """
 
 import os
-import tempfile
+import re
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock
 
 from langgraph_sandbox.config import Config
 from langgraph_sandbox.sandbox.session_manager import SessionManager, SessionStorage, DatasetAccess
@@ -18,372 +17,326 @@ from langgraph_sandbox.tool_factory.make_tools import (
     make_export_datasets_tool
 )
 
+# Expected validation errors, compiled once for pytest.raises(match=...)
+_HYBRID_PATH_ERR = re.compile(r"HYBRID_LOCAL_PATH is required when DATASET_ACCESS=HYBRID")
+_HYBRID_MANAGER_PATH_ERR = re.compile(r"hybrid_local_path is required when dataset_access=HYBRID")
+
+
+# Docker and HTTP doubles are built once at import and reset per test, instead
+# of having mock.patch construct fresh MagicMocks for every invocation.
+_SHARED_CONTAINER = Mock()
+_SHARED_CONTAINER.id = "test-container-id"
+_SHARED_CONTAINER.attrs = {
+    "NetworkSettings": {
+        "Ports": {
+            "9000/tcp": [{"HostPort": "12345"}]
+        }
+    }
+}
+_SHARED_CLIENT = Mock()
+_SHARED_CLIENT.containers.run.return_value = _SHARED_CONTAINER
+# No existing container: the lookup before creation fails
+_SHARED_CLIENT.containers.get.side_effect = Exception("Container not found")
+
+_SHARED_HTTP = MagicMock()
+_SHARED_HTTP.return_value.__enter__.return_value.get.return_value = Mock(status_code=200)
+
+
+@pytest.fixture
+def docker_mock(monkeypatch):
+    """Route docker.from_env() and httpx.Client to the shared module-level mocks."""
+    _SHARED_CLIENT.reset_mock()
+    _SHARED_HTTP.reset_mock()
+    monkeypatch.setattr("docker.from_env", lambda: _SHARED_CLIENT)
+    monkeypatch.setattr("httpx.Client", _SHARED_HTTP)
+    return _SHARED_CLIENT
+
 
 class TestHybridModeConfig:
     """Test HYBRID mode configuration loading and validation."""
-    
     def setup_method(self):
         """Clean up environment variables before each test."""
         for key in ['DATASET_ACCESS', 'HYBRID_LOCAL_PATH', 'SESSION_STORAGE']:
             if key in os.environ:
                 del os.environ[key]
     
-    def test_hybrid_mode_config_loading(self):
+    def test_hybrid_mode_config_loading(self, tmp_path):
         """Test that HYBRID mode can be configured correctly."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            # Create test files
-            (hybrid_data_dir / "dataset1.parquet").write_text("test data 1")
-            (hybrid_data_dir / "dataset2.parquet").write_text("test data 2")
-            
-            # Create env file for HYBRID mode
-            env_file = temp_path / "test_sandbox.env"
-            env_content = f"""
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        # Create test files
+        (hybrid_data_dir / "dataset1.parquet").write_text("test data 1")
+        (hybrid_data_dir / "dataset2.parquet").write_text("test data 2")
+        
+        # Create env file for HYBRID mode
+        env_file = tmp_path / "test_sandbox.env"
+        env_content = f"""
 SESSION_STORAGE=TMPFS
 DATASET_ACCESS=HYBRID
 HYBRID_LOCAL_PATH={hybrid_data_dir}
-SESSIONS_ROOT={temp_path / "sessions"}
-BLOBSTORE_DIR={temp_path / "blobstore"}
-ARTIFACTS_DB={temp_path / "artifacts.db"}
+SESSIONS_ROOT={tmp_path / "sessions"}
+BLOBSTORE_DIR={tmp_path / "blobstore"}
+ARTIFACTS_DB={tmp_path / "artifacts.db"}
 SANDBOX_IMAGE=sandbox:latest
 TMPFS_SIZE_MB=512
 """
-            env_file.write_text(env_content)
-            
-            # Test configuration loading
-            cfg = Config.from_env(env_file_path=env_file)
-            
-            # Verify configuration
-            assert cfg.dataset_access == DatasetAccess.HYBRID
-            assert cfg.hybrid_local_path == hybrid_data_dir
-            assert cfg.uses_hybrid_mode == True
-            assert cfg.mode_id() == "TMPFS_HYBRID"
-            # In HYBRID mode, datasets_host_ro should be None (we use hybrid_local_path instead)
+        env_file.write_text(env_content)
+        
+        # Test configuration loading
+        cfg = Config.from_env(env_file_path=env_file)
+        
+        # Verify configuration
+        assert cfg.dataset_access == DatasetAccess.HYBRID
+        assert cfg.hybrid_local_path == hybrid_data_dir
+        assert cfg.uses_hybrid_mode == True
+        assert cfg.mode_id() == "TMPFS_HYBRID"
+        # In HYBRID mode, datasets_host_ro should be None (we use hybrid_local_path instead)
         # But the test might have leftover data from other tests, so we check the mode instead
         assert cfg.dataset_access == DatasetAccess.HYBRID
     
-    def test_hybrid_mode_validation_missing_path(self):
+    def test_hybrid_mode_validation_missing_path(self, tmp_path, monkeypatch):
         """Test that HYBRID mode requires hybrid_local_path."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create env file without HYBRID_LOCAL_PATH
-            env_file = temp_path / "test_sandbox.env"
-            env_content = """
-SESSION_STORAGE=TMPFS
-DATASET_ACCESS=HYBRID
-SESSIONS_ROOT=./sessions
-BLOBSTORE_DIR=./blobstore
-ARTIFACTS_DB=./artifacts.db
-SANDBOX_IMAGE=sandbox:latest
-TMPFS_SIZE_MB=512
-"""
-            env_file.write_text(env_content)
-            
-            # Should raise ValueError
-            with pytest.raises(ValueError, match="HYBRID_LOCAL_PATH is required when DATASET_ACCESS=HYBRID"):
-                Config.from_env(env_file_path=env_file)
+        # Configure through the process env (no env file; no sandbox.env in cwd)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("DATASET_ACCESS", "HYBRID")
+        monkeypatch.delenv("HYBRID_LOCAL_PATH", raising=False)
+
+        with pytest.raises(ValueError, match=_HYBRID_PATH_ERR):
+            Config.from_env()
     
-    def test_hybrid_mode_bind_storage(self):
+    def test_hybrid_mode_bind_storage(self, tmp_path):
         """Test HYBRID mode with BIND storage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            env_file = temp_path / "test_sandbox.env"
-            env_content = f"""
-SESSION_STORAGE=BIND
-DATASET_ACCESS=HYBRID
-HYBRID_LOCAL_PATH={hybrid_data_dir}
-SESSIONS_ROOT={temp_path / "sessions"}
-BLOBSTORE_DIR={temp_path / "blobstore"}
-ARTIFACTS_DB={temp_path / "artifacts.db"}
-SANDBOX_IMAGE=sandbox:latest
-TMPFS_SIZE_MB=512
-"""
-            env_file.write_text(env_content)
-            
-            cfg = Config.from_env(env_file_path=env_file)
-            
-            assert cfg.dataset_access == DatasetAccess.HYBRID
-            assert cfg.session_storage == SessionStorage.BIND
-            assert cfg.mode_id() == "BIND_HYBRID"
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        cfg = Config(
+            session_storage=SessionStorage.BIND,
+            dataset_access=DatasetAccess.HYBRID,
+            hybrid_local_path=hybrid_data_dir,
+            sessions_root=tmp_path / "sessions",
+            blobstore_dir=tmp_path / "blobstore",
+            artifacts_db_path=tmp_path / "artifacts.db",
+            tmpfs_size_mb=512,
+        )
+        
+        assert cfg.dataset_access == DatasetAccess.HYBRID
+        assert cfg.session_storage == SessionStorage.BIND
+        assert cfg.mode_id() == "BIND_HYBRID"
     
-    def test_hybrid_mode_properties(self):
+    def test_hybrid_mode_properties(self, tmp_path):
         """Test HYBRID mode specific properties."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            env_file = temp_path / "test_sandbox.env"
-            env_content = f"""
-SESSION_STORAGE=TMPFS
-DATASET_ACCESS=HYBRID
-HYBRID_LOCAL_PATH={hybrid_data_dir}
-SESSIONS_ROOT={temp_path / "sessions"}
-BLOBSTORE_DIR={temp_path / "blobstore"}
-ARTIFACTS_DB={temp_path / "artifacts.db"}
-SANDBOX_IMAGE=sandbox:latest
-TMPFS_SIZE_MB=512
-"""
-            env_file.write_text(env_content)
-            
-            cfg = Config.from_env(env_file_path=env_file)
-            
-            # Test mode-specific properties
-            assert cfg.uses_hybrid_mode == True
-            assert cfg.uses_api_staging == True  # HYBRID supports API staging
-            assert cfg.uses_local_ro == False     # HYBRID is not pure LOCAL_RO
-            assert cfg.uses_no_datasets == False
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        cfg = Config(
+            session_storage=SessionStorage.TMPFS,
+            dataset_access=DatasetAccess.HYBRID,
+            hybrid_local_path=hybrid_data_dir,
+            sessions_root=tmp_path / "sessions",
+            blobstore_dir=tmp_path / "blobstore",
+            artifacts_db_path=tmp_path / "artifacts.db",
+            tmpfs_size_mb=512,
+        )
+        
+        # Test mode-specific properties
+        assert cfg.uses_hybrid_mode == True
+        assert cfg.uses_api_staging == True  # HYBRID supports API staging
+        assert cfg.uses_local_ro == False     # HYBRID is not pure LOCAL_RO
+        assert cfg.uses_no_datasets == False
 
 
 class TestHybridModeSessionManager:
     """Test SessionManager with HYBRID mode."""
-    
-    def test_session_manager_hybrid_initialization(self):
+    def test_session_manager_hybrid_initialization(self, docker_mock, tmp_path):
         """Test SessionManager initialization with HYBRID mode."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            # Test successful initialization
-            session_manager = SessionManager(
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        # Test successful initialization
+        session_manager = SessionManager(
+            image="sandbox:latest",
+            session_storage=SessionStorage.TMPFS,
+            dataset_access=DatasetAccess.HYBRID,
+            hybrid_local_path=hybrid_data_dir,
+            session_root=tmp_path / "sessions",
+            tmpfs_size="512m",
+            address_strategy="host"
+        )
+        
+        # Verify properties
+        assert session_manager.dataset_access == DatasetAccess.HYBRID
+        assert session_manager.hybrid_local_path == hybrid_data_dir
+        assert session_manager.datasets_path is None  # Should be None in HYBRID mode
+    
+    def test_session_manager_hybrid_validation(self, docker_mock, tmp_path):
+        """Test SessionManager validation for HYBRID mode."""
+        # Test missing hybrid_local_path
+        with pytest.raises(ValueError, match=_HYBRID_MANAGER_PATH_ERR):
+            SessionManager(
                 image="sandbox:latest",
                 session_storage=SessionStorage.TMPFS,
                 dataset_access=DatasetAccess.HYBRID,
-                hybrid_local_path=hybrid_data_dir,
-                session_root=temp_path / "sessions",
-                tmpfs_size="512m",
-                address_strategy="host"
+                hybrid_local_path=None,  # Missing required parameter
+                session_root=tmp_path / "sessions",
+                tmpfs_size="512m"
             )
-            
-            # Verify properties
-            assert session_manager.dataset_access == DatasetAccess.HYBRID
-            assert session_manager.hybrid_local_path == hybrid_data_dir
-            assert session_manager.datasets_path is None  # Should be None in HYBRID mode
-    
-    def test_session_manager_hybrid_validation(self):
-        """Test SessionManager validation for HYBRID mode."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Test missing hybrid_local_path
-            with pytest.raises(ValueError, match="hybrid_local_path is required when dataset_access=HYBRID"):
-                SessionManager(
-                    image="sandbox:latest",
-                    session_storage=SessionStorage.TMPFS,
-                    dataset_access=DatasetAccess.HYBRID,
-                    hybrid_local_path=None,  # Missing required parameter
-                    session_root=temp_path / "sessions",
-                    tmpfs_size="512m"
-                )
     
-    @patch('docker.from_env')
-    def test_session_manager_hybrid_volume_mounting(self, mock_docker):
+    def test_session_manager_hybrid_volume_mounting(self, docker_mock, tmp_path):
         """Test that HYBRID mode correctly sets up volume mounting."""
-        # Mock Docker client
-        mock_client = Mock()
-        mock_docker.return_value = mock_client
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
         
-        # Mock container creation - first call should raise NotFound (no existing container)
-        mock_client.containers.get.side_effect = Exception("Container not found")
+        session_manager = SessionManager(
+            image="sandbox:latest",
+            session_storage=SessionStorage.TMPFS,
+            dataset_access=DatasetAccess.HYBRID,
+            hybrid_local_path=hybrid_data_dir,
+            session_root=tmp_path / "sessions",
+            tmpfs_size="512m",
+            address_strategy="host"
+        )
         
-        # Mock new container creation
-        mock_container = Mock()
-        mock_container.id = "test-container-id"
-        mock_container.attrs = {
-            "NetworkSettings": {
-                "Ports": {
-                    "9000/tcp": [{"HostPort": "12345"}]
-                }
-            }
-        }
-        mock_client.containers.run.return_value = mock_container
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            session_manager = SessionManager(
-                image="sandbox:latest",
-                session_storage=SessionStorage.TMPFS,
-                dataset_access=DatasetAccess.HYBRID,
-                hybrid_local_path=hybrid_data_dir,
-                session_root=temp_path / "sessions",
-                tmpfs_size="512m",
-                address_strategy="host"
-            )
-            
-            # Mock the HTTP client for health check
-            with patch('httpx.Client') as mock_http:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_http.return_value.__enter__.return_value.get.return_value = mock_response
-                
-                # Start session (this will trigger volume mounting)
-                session_id = session_manager.start("test-session")
-                
-                # Verify container was created with correct volume mounting
-                mock_client.containers.run.assert_called_once()
-                call_args = mock_client.containers.run.call_args
-                
-                # Check that volumes include the hybrid_local_path
-                volumes = call_args.kwargs.get('volumes', {})
-                assert str(hybrid_data_dir) in volumes
-                assert volumes[str(hybrid_data_dir)]["bind"] == "/data"
-                assert volumes[str(hybrid_data_dir)]["mode"] == "ro"
+        # Start session (this will trigger volume mounting)
+        session_id = session_manager.start("test-session")
+        
+        # Verify container was created with correct volume mounting
+        docker_mock.containers.run.assert_called_once()
+        call_args = docker_mock.containers.run.call_args
+        
+        # Check that volumes include the hybrid_local_path
+        volumes = call_args.kwargs.get('volumes', {})
+        assert str(hybrid_data_dir) in volumes
+        assert volumes[str(hybrid_data_dir)]["bind"] == "/data"
+        assert volumes[str(hybrid_data_dir)]["mode"] == "ro"
 
 
 class TestHybridModeTools:
     """Test tool factory functions with HYBRID mode."""
-    
-    def test_list_datasets_tool_hybrid_mode(self):
+    def test_list_datasets_tool_hybrid_mode(self, tmp_path):
         """Test list_datasets_tool with HYBRID mode."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            # Create test files
-            (hybrid_data_dir / "local_dataset.parquet").write_text("local data")
-            (hybrid_data_dir / "another_file.csv").write_text("csv data")
-            
-            # Mock SessionManager
-            mock_session_manager = Mock()
-            mock_session_manager.start = Mock()
-            
-            # Mock container and exec_run for listing files
-            mock_container = Mock()
-            mock_session_manager.container_for.return_value = mock_container
-            
-            # Mock the exec_run result for listing files
-            mock_container.exec_run.return_value = (0, (
-                b'{"mode": "HYBRID mode (local + API datasets)", "path": "/data", "files": ['
-                b'{"name": "local_dataset.parquet", "path": "/data/local_dataset.parquet", "size": 10, "modified": 1234567890}, '
-                b'{"name": "another_file.csv", "path": "/data/another_file.csv", "size": 8, "modified": 1234567891}'
-                b'], "count": 2}\n'
-            ))
-            
-            # Create the tool
-            list_tool = make_list_datasets_tool(
-                session_manager=mock_session_manager,
-                session_key_fn=lambda: "test-session"
-            )
-            
-            # Test the tool (this would normally be async, but we're testing the setup)
-            assert list_tool is not None
-            assert callable(list_tool)
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        # Create test files
+        (hybrid_data_dir / "local_dataset.parquet").write_text("local data")
+        (hybrid_data_dir / "another_file.csv").write_text("csv data")
+        
+        # Mock SessionManager
+        mock_session_manager = Mock()
+        mock_session_manager.start = Mock()
+        
+        # Mock container and exec_run for listing files
+        mock_container = Mock()
+        mock_session_manager.container_for.return_value = mock_container
+        
+        # Mock the exec_run result for listing files
+        mock_container.exec_run.return_value = (0, (
+            b'{"mode": "HYBRID mode (local + API datasets)", "path": "/data", "files": ['
+            b'{"name": "local_dataset.parquet", "path": "/data/local_dataset.parquet", "size": 10, "modified": 1234567890}, '
+            b'{"name": "another_file.csv", "path": "/data/another_file.csv", "size": 8, "modified": 1234567891}'
+            b'], "count": 2}\n'
+        ))
+        
+        # Create the tool
+        list_tool = make_list_datasets_tool(
+            session_manager=mock_session_manager,
+            session_key_fn=lambda: "test-session"
+        )
+        
+        # Test the tool (this would normally be async, but we're testing the setup)
+        assert list_tool is not None
+        assert callable(list_tool)
     
-    def test_export_datasets_tool_hybrid_mode(self):
+    def test_export_datasets_tool_hybrid_mode(self, tmp_path):
         """Test export_datasets_tool with HYBRID mode."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            # Mock SessionManager
-            mock_session_manager = Mock()
-            mock_session_manager.export_file.return_value = {
-                "success": True,
-                "host_path": "/tmp/exported_file.parquet",
-                "download_url": "http://localhost:8000/artifacts/test-id"
-            }
-            
-            # Create the tool
-            export_tool = make_export_datasets_tool(
-                session_manager=mock_session_manager,
-                session_key_fn=lambda: "test-session"
-            )
-            
-            # Test the tool
-            assert export_tool is not None
-            assert callable(export_tool)
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        # Mock SessionManager
+        mock_session_manager = Mock()
+        mock_session_manager.export_file.return_value = {
+            "success": True,
+            "host_path": "/tmp/exported_file.parquet",
+            "download_url": "http://localhost:8000/artifacts/test-id"
+        }
+        
+        # Create the tool
+        export_tool = make_export_datasets_tool(
+            session_manager=mock_session_manager,
+            session_key_fn=lambda: "test-session"
+        )
+        
+        # Test the tool
+        assert export_tool is not None
+        assert callable(export_tool)
     
-    def test_select_dataset_tool_hybrid_mode(self):
+    def test_select_dataset_tool_hybrid_mode(self, tmp_path):
         """Test select_dataset_tool with HYBRID mode."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            # Mock SessionManager
-            mock_session_manager = Mock()
-            mock_session_manager.start = Mock()
-            mock_session_manager.container_for.return_value = Mock()
-            
-            # Mock fetch function
-            async def mock_fetch_fn(ds_id: str) -> bytes:
-                return f"dataset data for {ds_id}".encode()
-            
-            # Create the tool
-            select_tool = make_select_dataset_tool(
-                session_manager=mock_session_manager,
-                session_key_fn=lambda: "test-session",
-                fetch_fn=mock_fetch_fn
-            )
-            
-            # Test the tool
-            assert select_tool is not None
-            assert callable(select_tool)
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        # Mock SessionManager
+        mock_session_manager = Mock()
+        mock_session_manager.start = Mock()
+        mock_session_manager.container_for.return_value = Mock()
+        
+        # Mock fetch function
+        async def mock_fetch_fn(ds_id: str) -> bytes:
+            return f"dataset data for {ds_id}".encode()
+        
+        # Create the tool
+        select_tool = make_select_dataset_tool(
+            session_manager=mock_session_manager,
+            session_key_fn=lambda: "test-session",
+            fetch_fn=mock_fetch_fn
+        )
+        
+        # Test the tool
+        assert select_tool is not None
+        assert callable(select_tool)
 
 
 class TestUnifiedDataPath:
     """Test unified /data/ path functionality."""
-    
-    def test_config_unified_data_path(self):
+    def test_config_unified_data_path(self, tmp_path):
         """Test that config uses unified /data/ path."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            env_file = temp_path / "test_sandbox.env"
-            env_content = f"""
-SESSION_STORAGE=TMPFS
-DATASET_ACCESS=HYBRID
-HYBRID_LOCAL_PATH={hybrid_data_dir}
-SESSIONS_ROOT={temp_path / "sessions"}
-BLOBSTORE_DIR={temp_path / "blobstore"}
-ARTIFACTS_DB={temp_path / "artifacts.db"}
-SANDBOX_IMAGE=sandbox:latest
-TMPFS_SIZE_MB=512
-"""
-            env_file.write_text(env_content)
-            
-            cfg = Config.from_env(env_file_path=env_file)
-            
-            # Verify unified data path
-            assert cfg.container_data_staged == "/data"
-            assert cfg.container_data_ro == "/data"
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        cfg = Config(
+            session_storage=SessionStorage.TMPFS,
+            dataset_access=DatasetAccess.HYBRID,
+            hybrid_local_path=hybrid_data_dir,
+            sessions_root=tmp_path / "sessions",
+            blobstore_dir=tmp_path / "blobstore",
+            artifacts_db_path=tmp_path / "artifacts.db",
+            tmpfs_size_mb=512,
+        )
+        
+        # Verify unified data path
+        assert cfg.container_data_staged == "/data"
+        assert cfg.container_data_ro == "/data"
     
-    def test_tool_descriptions_unified_path(self):
+    def test_tool_descriptions_unified_path(self, tmp_path):
         """Test that tool descriptions reference unified /data/ path."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            hybrid_data_dir = temp_path / "test_hybrid_data"
-            hybrid_data_dir.mkdir()
-            
-            # Mock SessionManager
-            mock_session_manager = Mock()
-            mock_session_manager.start = Mock()
-            mock_session_manager.container_for.return_value = Mock()
-            
-            # Test export tool description
-            export_tool = make_export_datasets_tool(
-                session_manager=mock_session_manager,
-                session_key_fn=lambda: "test-session"
-            )
-            
-            # The tool should be callable and configured for /data/ path
-            assert export_tool is not None
-            assert callable(export_tool)
+        hybrid_data_dir = tmp_path / "test_hybrid_data"
+        hybrid_data_dir.mkdir()
+        
+        # Mock SessionManager
+        mock_session_manager = Mock()
+        mock_session_manager.start = Mock()
+        mock_session_manager.container_for.return_value = Mock()
+        
+        # Test export tool description
+        export_tool = make_export_datasets_tool(
+            session_manager=mock_session_manager,
+            session_key_fn=lambda: "test-session"
+        )
+        
+        # The tool should be callable and configured for /data/ path
+        assert export_tool is not None
+        assert callable(export_tool)
 
 
 if __name__ == "__main__":
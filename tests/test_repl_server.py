@@ -0,0 +1,30 @@
+import asyncio
+from contextlib import redirect_stdout
+
+from langgraph_sandbox.sandbox import repl_server
+from langgraph_sandbox.sandbox.repl_server import ExecRequest, TailBuffer, exec_code
+
+
+def test_tail_buffer_keeps_last_chars():
+    buf = TailBuffer(limit=10)
+    with redirect_stdout(buf):
+        for i in range(100):
+            print(i)
+    text = buf.getvalue()
+    assert text.endswith("97\n98\n99\n")
+    assert text.startswith("[... ")
+    assert buf.dropped == len("".join(f"{i}\n" for i in range(100))) - 10
+
+
+def test_tail_buffer_untruncated_output_is_unchanged():
+    buf = TailBuffer(limit=10)
+    buf.write("hello\n")
+    assert buf.getvalue() == "hello\n"
+
+
+def test_exec_stdout_is_bounded(monkeypatch):
+    monkeypatch.setattr(repl_server, "MAX_STDOUT_CHARS", 50)
+    result = asyncio.run(exec_code(ExecRequest(code="for i in range(10000): print(i)")))
+    assert result["ok"]
+    assert result["stdout"].endswith("9999\n")
+    assert len(result["stdout"]) < 200
@@ -1,6 +1,6 @@
-import os
 import tempfile
 from pathlib import Path
+import docker
 import pytest
 from unittest.mock import Mock, patch
 
@@ -10,7 +10,7 @@ from langgraph_sandbox.sandbox.session_manager import (
 
 # --- Monkeypatch ingest_files to simulate moving to a blobstore and deleting the local copy
 @pytest.fixture(autouse=True)
-def patch_ingest_files(monkeypatch, tmp_path):
+def patch_ingest_files(monkeypatch):
     """
     Mocks the ingestion process.
     This fake function gathers file metadata and then DELETES the source file,
@@ -37,10 +37,10 @@ def patch_ingest_files(monkeypatch, tmp_path):
     yield
 
 # Prepare a temporary LOCAL_RO datasets dir with one dummy file
-@pytest.fixture
-def ro_datasets_dir(tmp_path):
-    d = tmp_path / "datasets"
-    d.mkdir()
+# (read-only input: built once and shared by every test in the module)
+@pytest.fixture(scope="module")
+def ro_datasets_dir(tmp_path_factory):
+    d = tmp_path_factory.mktemp("datasets_ro")
     (d / "dummy.txt").write_text("dummy")
     return d
 
@@ -52,15 +52,28 @@ MODES = [
     ("BIND_API", SessionStorage.BIND,   DatasetAccess.API),
 ]
 
-@pytest.mark.parametrize("label, sess_store, data_access", MODES)
-@patch('langgraph_sandbox.sandbox.session_manager.docker.from_env')
+# Container double shared by every parametrized case (no test asserts on its calls)
+_MOCK_CONTAINER = Mock()
+_MOCK_CONTAINER.exec_run.return_value = (0, b"True\n")
+
+# REPL snippets shared by every parametrized case
+CODE_SET_A = "a=1; print('a=', a)"
+CODE_INC_A = "a+=2; print('a=', a)"
+CODE_RO_EXISTS = "import os; print(os.path.exists('/data/dummy.txt'))"
+CODE_API_STAGE = "import os, pathlib; pathlib.Path('/session/data').mkdir(parents=True, exist_ok=True); open('/session/data/sim.dat','w').write('x')"
+CODE_API_EXISTS = "import os; print(os.path.exists('/session/data/sim.dat'))"
+CODE_MKDIR_ARTIFACTS = 'from pathlib import Path; Path("/session/artifacts").mkdir(parents=True, exist_ok=True)'
+CODE_WRITE_ARTIFACT = """
+from pathlib import Path
+Path("/session/artifacts/test.txt").write_text("ok")
+print("artifact done")
+"""
+
+@pytest.mark.parametrize("label, sess_store, data_access", MODES, ids=[m[0] for m in MODES])
+@patch.object(docker, "from_env")
 def test_modes_end_to_end(mock_docker, label, sess_store, data_access, ro_datasets_dir):
     # Mock Docker client and container
-    mock_client = Mock()
-    mock_container = Mock()
-    mock_container.exec_run.return_value = (0, b"True\n")
-    mock_client.containers.run.return_value = mock_container
-    mock_docker.return_value = mock_client
+    mock_docker.return_value.containers.run.return_value = _MOCK_CONTAINER
     
     kwargs = {
         "session_storage": sess_store,
@@ -73,56 +86,49 @@ def test_modes_end_to_end(mock_docker, label, sess_store, data_access, ro_datase
     mgr = SessionManager(**kwargs)
     sid = mgr.start()
 
-    # Mock the exec method to avoid real container execution
+    # Mock the exec method to avoid real container execution:
+    # canned results keyed on the exact snippet, anything else gets an empty result
+    empty = {"stdout": "", "stderr": "", "artifacts": [], "session_dir": ""}
+    responses = {
+        CODE_SET_A: {**empty, "stdout": "a= 1\n"},
+        CODE_INC_A: {**empty, "stdout": "a= 3\n"},
+        CODE_RO_EXISTS: {**empty, "stdout": "True\n"},
+        CODE_API_EXISTS: {**empty, "stdout": "True\n"},
+        CODE_WRITE_ARTIFACT: {
+            "stdout": "artifact done\n",
+            "stderr": "",
+            "artifacts": [{"name": "test.txt", "id": "test.txt"}],
+            "session_dir": str(ro_datasets_dir / "session_dir") if sess_store == SessionStorage.BIND else ""
+        },
+    }
+
     def mock_exec(session_id, code):
-        if "a=1" in code:
-            return {"stdout": "a= 1\n", "stderr": "", "artifacts": [], "session_dir": ""}
-        elif "a+=2" in code:
-            return {"stdout": "a= 3\n", "stderr": "", "artifacts": [], "session_dir": ""}
-        elif "os.path.exists" in code:
-            return {"stdout": "True\n", "stderr": "", "artifacts": [], "session_dir": ""}
-        elif "mkdir" in code:
-            return {"stdout": "", "stderr": "", "artifacts": [], "session_dir": ""}
-        elif "test.txt" in code:
-            return {
-                "stdout": "artifact done\n", 
-                "stderr": "", 
-                "artifacts": [{"name": "test.txt", "id": "test.txt"}], 
-                "session_dir": str(ro_datasets_dir / "session_dir") if sess_store == SessionStorage.BIND else ""
-            }
-        else:
-            return {"stdout": "", "stderr": "", "artifacts": [], "session_dir": ""}
+        return responses.get(code, empty)
     
     mgr.exec = mock_exec
 
     # 1) REPL state persists
-    r1 = mgr.exec(sid, "a=1; print('a=', a)")
+    r1 = mgr.exec(sid, CODE_SET_A)
     assert "a= 1" in r1["stdout"]
 
-    r2 = mgr.exec(sid, "a+=2; print('a=', a)")
+    r2 = mgr.exec(sid, CODE_INC_A)
     assert "a= 3" in r2["stdout"]
 
     # 2) Dataset visibility by mode
     if data_access == DatasetAccess.LOCAL_RO:
-        out = mgr.exec(sid, "import os; print(os.path.exists('/data/dummy.txt'))")
+        out = mgr.exec(sid, CODE_RO_EXISTS)
         assert "True" in out["stdout"], f"{label}: /data/dummy.txt should exist"
     else:
         # API: typically staged to /session/data by your pipeline; simulate presence
-        mgr.exec(sid, "import os, pathlib; pathlib.Path('/session/data').mkdir(parents=True, exist_ok=True); open('/session/data/sim.dat','w').write('x')")
-        out = mgr.exec(sid, "import os; print(os.path.exists('/session/data/sim.dat'))")
+        mgr.exec(sid, CODE_API_STAGE)
+        out = mgr.exec(sid, CODE_API_EXISTS)
         assert "True" in out["stdout"], f"{label}: /session/data/sim.dat should exist"
 
     # 3) Artifact diff + ingest
     # **CRITICAL CHANGE**: Separate directory creation from file creation to avoid a
     # race condition with the docker daemon reading from tmpfs.
-    mgr.exec(sid, 'from pathlib import Path; Path("/session/artifacts").mkdir(parents=True, exist_ok=True)')
-    
-    code = """
-from pathlib import Path
-Path("/session/artifacts/test.txt").write_text("ok")
-print("artifact done")
-"""
-    r3 = mgr.exec(sid, code)
+    mgr.exec(sid, CODE_MKDIR_ARTIFACTS)
+    r3 = mgr.exec(sid, CODE_WRITE_ARTIFACT)
     assert r3["artifacts"], f"{label}: expected artifacts ingested"
     names = {a["name"] for a in r3["artifacts"]}
     assert "test.txt" in names
@@ -140,8 +146,8 @@ print("artifact done")
     mgr.stop(sid)
 
 # Bonus: idle sweep test (forces eviction)
-@patch('langgraph_sandbox.sandbox.session_manager.docker.from_env')
-def test_idle_sweep(mock_docker, tmp_path, ro_datasets_dir, monkeypatch):
+@patch.object(docker, "from_env")
+def test_idle_sweep(mock_docker):
     # Mock Docker client and container
     mock_client = Mock()
     mock_container = Mock()
@@ -165,3 +171,72 @@ def test_idle_sweep(mock_docker, tmp_path, ro_datasets_dir, monkeypatch):
     assert sid not in mgr.sessions
     mgr.stop(sid2)
 
+
+# Container handles are cached on the session: no daemon lookup per call
+@patch.object(docker, "from_env")
+def test_container_handle_is_cached(mock_docker):
+    mock_client = Mock()
+    mock_docker.return_value = mock_client
+
+    mgr = SessionManager(
+        session_storage=SessionStorage.TMPFS,
+        dataset_access=DatasetAccess.API,
+        tmpfs_size="256m",
+    )
+    sid = mgr.start("cached")
+    lookups = mock_client.containers.get.call_count
+
+    assert mgr.container_for(sid) is mgr.container_for(sid)
+    assert mgr.start(sid) == sid
+    assert mock_client.containers.get.call_count == lookups
+    mgr.stop(sid)
+
+
+# prewarm(): start() adopts the pre-started container instead of running one
+@patch.object(docker, "from_env")
+def test_start_adopts_prewarmed_container(mock_docker, monkeypatch):
+    mock_client = Mock()
+    mock_client.containers.get.side_effect = docker.errors.NotFound("no such container")
+    mock_docker.return_value = mock_client
+    monkeypatch.setattr(SessionManager, "_wait_ready", staticmethod(lambda base_url: None))
+
+    mgr = SessionManager(
+        session_storage=SessionStorage.TMPFS,
+        dataset_access=DatasetAccess.API,
+        tmpfs_size="256m",
+    )
+    mgr.prewarm(1)
+    sid = mgr.start("s1")
+
+    assert mock_client.containers.run.call_count == 1
+    assert mock_client.containers.run.call_args.kwargs["name"].startswith("sbox-warm-")
+    warm = mock_client.containers.run.return_value
+    warm.rename.assert_called_once_with("sbox-s1")
+    assert mgr.container_for(sid) is warm
+
+    # Pool is empty now: the next session runs its own container
+    mgr.start("s2")
+    assert mock_client.containers.run.call_args.kwargs["name"] == "sbox-s2"
+
+
+# Pre-started containers nobody adopted are removed on cleanup
+@patch.object(docker, "from_env")
+def test_unadopted_prewarmed_containers_are_removed(mock_docker, monkeypatch):
+    mock_client = Mock()
+    mock_docker.return_value = mock_client
+    monkeypatch.setattr(SessionManager, "_wait_ready", staticmethod(lambda base_url: None))
+    monkeypatch.setattr(
+        "langgraph_sandbox.sandbox.session_manager.cleanup_sandbox_containers", lambda **kwargs: []
+    )
+
+    mgr = SessionManager(
+        session_storage=SessionStorage.TMPFS,
+        dataset_access=DatasetAccess.API,
+        tmpfs_size="256m",
+    )
+    mgr.prewarm(2)
+    warm = mock_client.containers.run.return_value
+
+    assert len(mgr.cleanup_all_containers(verbose=False)) == 2
+    assert warm.remove.call_count == 2
+    assert not mgr._warm and mgr._warm_executor is None
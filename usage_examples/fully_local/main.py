@@ -13,11 +13,18 @@ os.environ["BLOBSTORE_DIR"] = str(Path("example1_blobstore").resolve())
 
 from langgraph.checkpoint.memory import InMemorySaver
 from dotenv import load_dotenv
+import asyncio
+import threading
+import traceback
 import uuid
 
-from fastapi import FastAPI
+try:
+    import uvloop  # faster event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
 from langgraph_sandbox.artifacts.store import ensure_artifact_store
-from langgraph_sandbox.artifacts.api import router as artifacts_router
+from langgraph_sandbox.artifacts.server import start_artifact_server
 from langgraph_sandbox.datasets.startup import initialize_local_datasets
 
 from langgraph_sandbox.dataset_manager.cache import clear_cache
@@ -30,8 +37,6 @@ from langgraph_sandbox.artifacts.reader import fetch_artifact_urls
 
 if __name__ == "__main__":
 
-    app = FastAPI()
-
     env = load_dotenv("fully_local.env")
     if env == True: 
         print("Loaded .env file")
@@ -52,26 +57,22 @@ if __name__ == "__main__":
     # Set the session ID for the code execution tool
     set_session_id(convo_id)
     
-    # Initialize datasets for this specific conversation
-    initialize_local_datasets(cfg, session_id=convo_id)
-
-    app.include_router(artifacts_router) # register endpoints
+    # Initialize datasets for this specific conversation, in the background
+    # while the artifact server starts and the graph is compiled
+    init_errors = []
 
-    # Start the FastAPI server for artifacts
-    import uvicorn
-    import threading
-    import time
-    
-    def run_server():
+    def init_datasets():
         try:
-            uvicorn.run(app, host="0.0.0.0", port=8000, log_level="error")
+            initialize_local_datasets(cfg, session_id=convo_id)
         except Exception as e:
-            print(f"Server error: {e}")
-    
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
-    time.sleep(2)  # Give the server time to start
-    print("Artifact server started on http://localhost:8000")
+            init_errors.append(e)
+
+    init_thread = threading.Thread(target=init_datasets, daemon=True)
+    init_thread.start()
+
+    # Start the FastAPI server for artifacts (the shared launcher builds the app)
+    server_port = start_artifact_server()
+    print(f"Artifact server started on http://localhost:{server_port}")
 
     builder = get_builder()
 
@@ -79,10 +80,19 @@ if __name__ == "__main__":
 
     graph = builder.compile(checkpointer=memory)
 
+    # Datasets must be in the cache before the first turn
+    init_thread.join()
+    if init_errors:
+        raise init_errors[0]
+
     print("=== Type /bye to exit. ===\n")
 
     usr_msg = ""
 
+    # One event loop for the whole conversation (uvloop if installed): async
+    # clients and connection pools created while streaming stay usable across turns
+    runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+
     while True:
 
         usr_msg = input("User: ")
@@ -96,26 +106,17 @@ if __name__ == "__main__":
         
         try:
             # Use streaming to see real-time output and errors
-            import asyncio
-            
             async def run_stream():
                 async for chunk in graph.astream(
                     {"messages": [{"role": "user", "content": usr_msg}]},
                     {"configurable": {"thread_id": f"{convo_id}"}, "recursion_limit": 25},
                 ):
                     print(f"AI: {chunk['chat_model']['messages'][-1].content}")
-                    
-                    # Check if this is the final result
-                    if "messages" in chunk and chunk["messages"]:
-                        last_message = chunk["messages"][-1]
-                        if hasattr(last_message, 'content') and last_message.content:
-                            print(f"\nAI: {last_message.content}")
             
-            asyncio.run(run_stream())
+            runner.run(run_stream())
                         
         except Exception as e:
             print(f"\nERROR: {e}")
-            import traceback
             traceback.print_exc()
         
         # you can handle artifact detection here - though it is not needed because it is handled by the general artifact system
@@ -130,4 +131,6 @@ if __name__ == "__main__":
                 print(f"    Size: {artifact['size']} bytes")
                 print()'''
         
-        print("\n" + "="*50 + "\n")
\ No newline at end of file
+        print("\n" + "="*50 + "\n")
+
+    runner.close()
\ No newline at end of file
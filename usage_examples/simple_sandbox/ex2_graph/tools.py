@@ -5,39 +5,37 @@ from langgraph_sandbox.artifacts.tokens import create_download_url
 from langgraph_sandbox.artifacts.reader import get_metadata
 from langgraph_sandbox.sandbox.session_manager import SessionManager
 from typing import List, Dict
+from contextvars import ContextVar
 import re
 
 cfg = Config.from_env(env_file_path=Path("simple_sandbox.env"))
 
-# Global variable to store the current session ID
-_current_session_id = None
+# Current session ID; a ContextVar so concurrent conversations (tasks) each
+# see their own. Falls back to a default if not set
+_current_session_id: ContextVar[str] = ContextVar("session_id", default="conv")
 
 def get_session_key():
     """Get session key from the conversation context."""
-    global _current_session_id
-    if _current_session_id is None:
-        # Fallback to a default if not set
-        return "conv"
-    return _current_session_id
+    return _current_session_id.get()
 
 def set_session_id(session_id: str):
     """Set the current session ID for the code execution tool."""
-    global _current_session_id
-    _current_session_id = session_id
+    _current_session_id.set(session_id)
 
 # Artifact fetching is now handled by the general artifact system
 # Import the function from the general location
 from langgraph_sandbox.artifacts.reader import fetch_artifact_urls
 
+# Artifact ID pattern (assuming they start with 'art_'), compiled once
+_ART_RE = re.compile(r'art_[a-zA-Z0-9_-]+')
+
 def extract_artifact_references(text: str) -> List[str]:
     """
     Extract artifact references from text that might contain artifact IDs.
     Looks for patterns like 'art_...' or mentions of artifacts.
     """
-    # Look for artifact ID patterns (assuming they start with 'art_')
-    artifact_pattern = r'art_[a-zA-Z0-9_-]+'
-    matches = re.findall(artifact_pattern, text)
-    return list(set(matches))  # Remove duplicates
+    # De-duplicate in one pass, keeping first-seen order
+    return list(dict.fromkeys(_ART_RE.findall(text)))
 
 # Create single session manager instance
 session_manager = SessionManager(
@@ -13,11 +13,19 @@ os.environ["BLOBSTORE_DIR"] = str(Path("simple_blobstore").resolve())
 
 from langgraph.checkpoint.memory import InMemorySaver
 from dotenv import load_dotenv
+import asyncio
+import threading
+import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop  # faster event loop; not available on Windows
+except ImportError:
+    uvloop = None
 
-from fastapi import FastAPI
 from langgraph_sandbox.artifacts.store import ensure_artifact_store
-from langgraph_sandbox.artifacts.api import router as artifacts_router
+from langgraph_sandbox.artifacts.server import serve_artifact_server
 
 from langgraph_sandbox.config import Config
 from ex2_graph.simple_ex_graph import get_builder
@@ -26,20 +34,24 @@ from langgraph_sandbox.sandbox.container_utils import cleanup_sandbox_containers
 from langgraph_sandbox.artifacts.reader import fetch_artifact_urls
 
 def main():
-    app = FastAPI()
-
     env = load_dotenv("simple_sandbox.env")
     if env == True: 
         print("Loaded .env file")
     else:
         print("No .env file found")
     
-    ensure_artifact_store() # bootstrap storage using environment variables
+    # Storage bootstrap (disk) and container cleanup (Docker) are independent:
+    # run them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        store_ready = pool.submit(ensure_artifact_store) # bootstrap storage using environment variables
 
-    cfg = Config.from_env(env_file_path=Path("simple_sandbox.env"))
-    
-    # Clean up any existing sandbox containers to avoid conflicts
-    cleanup_sandbox_containers()
+        # Clean up any existing sandbox containers to avoid conflicts
+        cleanup_done = pool.submit(cleanup_sandbox_containers)
+
+        cfg = Config.from_env(env_file_path=Path("simple_sandbox.env"))
+
+        store_ready.result()
+        cleanup_done.result()
     
     # Generate a unique session ID for this conversation
     convo_id = str(uuid.uuid4())[:8]
@@ -47,24 +59,6 @@ def main():
     
     # Set the session ID for the code execution tool
     set_session_id(convo_id)
-    
-    app.include_router(artifacts_router) # register endpoints
-
-    # Start the FastAPI server for artifacts
-    import uvicorn
-    import threading
-    import time
-    
-    def run_server():
-        try:
-            uvicorn.run(app, host="0.0.0.0", port=8000, log_level="error")
-        except Exception as e:
-            print(f"Server error: {e}")
-    
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
-    time.sleep(2)  # Give the server time to start
-    print("Artifact server started on http://localhost:8000")
 
     builder = get_builder()
 
@@ -72,41 +66,70 @@ def main():
 
     graph = builder.compile(checkpointer=memory)
 
+    # One event loop for the whole conversation (uvloop if installed): the
+    # artifact server and graph streaming share it, and async clients and
+    # connection pools created while streaming stay usable across turns
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        runner.run(chat(graph, convo_id))
+
+async def ainput(prompt: str) -> str:
+    """input() on a daemon thread, so the event loop keeps serving artifacts while the user types."""
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+
+    def resolve(set_outcome, value):
+        if not fut.done():
+            set_outcome(value)
+
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError / KeyboardInterrupt belong to the caller
+            loop.call_soon_threadsafe(resolve, fut.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(resolve, fut.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await fut
+
+async def chat(graph, convo_id):
+    # Start the FastAPI server for artifacts on this loop (no extra thread/loop)
+    server, server_task, server_port = await serve_artifact_server()
+    print(f"Artifact server started on http://localhost:{server_port}")
+
     print("\n=== Simple Sandbox Example (TMPFS_NONE mode) ===\n")
     print("\n=== Type /bye to exit. ===\n")
 
     usr_msg = ""
 
-    while True:
+    try:
+        while True:
 
-        usr_msg = input("User: ")
+            usr_msg = await ainput("User: ")
 
-        if "/bye" in usr_msg.lower():
-            break
+            if "/bye" in usr_msg.lower():
+                break
 
-        print(f"\n--- Thinking ... ---\n")
-        
-        try:
-            # Use streaming to see real-time output and errors
-            import asyncio
+            print(f"\n--- Thinking ... ---\n")
             
-            async def run_stream():
+            try:
+                # Use streaming to see real-time output and errors
                 async for chunk in graph.astream(
                     {"messages": [{"role": "user", "content": usr_msg}]},
                     {"configurable": {"thread_id": f"{convo_id}"}, "recursion_limit": 25},
                 ):
                     print(f"AI: {chunk['chat_model']['messages'][-1].content}")
+                            
+            except Exception as e:
+                print(f"\nERROR: {e}")
+                traceback.print_exc()
+            
+            # Artifacts are displayed directly in the agent's response
             
-            asyncio.run(run_stream())
-                        
-        except Exception as e:
-            print(f"\nERROR: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        # Artifacts are displayed directly in the agent's response
-        
-        print("\n" + "="*50 + "\n")
+            print("\n" + "="*50 + "\n")
+    finally:
+        server.should_exit = True
+        await server_task
 
 if __name__ == "__main__":
     main()
@@ -18,6 +18,7 @@ Rules:
 
 DATASET WORKFLOW:
 - Use `list_catalog` tool to search for available datasets with keywords
+- Use `describe_datasets` tool to read the descriptions and columns of the candidate datasets (pass all their ids in one call)
 - Use `select_dataset` tool to immediately fetch and load datasets into the sandbox
 - Use `code_exec_tool` to run Python code - datasets are already loaded and available
 - Check `/session/data/` directory to see what datasets are available in the sandbox
@@ -2,50 +2,61 @@ from langgraph_sandbox.tool_factory.make_tools import make_code_sandbox_tool, ma
 from langgraph_sandbox.config import Config
 from langgraph_sandbox.artifacts.tokens import create_download_url
 from langgraph_sandbox.artifacts.reader import get_metadata, fetch_artifact_urls
-from opendata_api.helpers import get_dataset_bytes, list_catalog
+from opendata_api.helpers import describe_datasets, get_dataset_bytes, list_catalog, prefetch_datasets
 from opendata_api.client import BolognaOpenData
 from pathlib import Path
 from langgraph_sandbox.sandbox.session_manager import SessionManager
 from typing import List, Dict
+from contextvars import ContextVar
+import asyncio
+import os
 import re
 from typing_extensions import Annotated
 from langchain_core.tools import tool, InjectedToolCallId
 from langgraph.types import Command
 from langchain_core.messages import ToolMessage
-import json
+import orjson
 
 cfg = Config.from_env(env_file_path=Path("tmpfs_api.env"))
 
-# Global variable to store the current session ID
-_current_session_id = None
+# Current session ID; a ContextVar so concurrent conversations (tasks) each
+# see their own. Falls back to a default if not set
+_current_session_id: ContextVar[str] = ContextVar("session_id", default="conv")
 
 def get_session_key():
     """Get session key from the conversation context."""
-    global _current_session_id
-    if _current_session_id is None:
-        # Fallback to a default if not set
-        return "conv"
-    return _current_session_id
+    return _current_session_id.get()
 
 def set_session_id(session_id: str):
     """Set the current session ID for the code execution tool."""
-    global _current_session_id
-    _current_session_id = session_id
+    _current_session_id.set(session_id)
 
 
+# Artifact ID pattern (assuming they start with 'art_'), compiled once
+_ART_RE = re.compile(r'art_[a-zA-Z0-9_-]+')
+
 def extract_artifact_references(text: str) -> List[str]:
     """
     Extract artifact references from text that might contain artifact IDs.
     Looks for patterns like 'art_...' or mentions of artifacts.
     """
-    # Look for artifact ID patterns (assuming they start with 'art_')
-    artifact_pattern = r'art_[a-zA-Z0-9_-]+'
-    matches = re.findall(artifact_pattern, text)
-    return list(set(matches))  # Remove duplicates
+    # De-duplicate in one pass, keeping first-seen order
+    return list(dict.fromkeys(_ART_RE.findall(text)))
 
 
 client = BolognaOpenData()  # close it in main then
 
+# Opt-in (OPENDATA_PREFETCH=1): the top catalog result is downloaded in the
+# background while the model decides which dataset to select (select_dataset
+# then finds it in the cache). Off by default: exploratory searches would
+# otherwise download full datasets nobody selects.
+_PREFETCH_TOP_K = 1
+_prefetch_tasks: set = set()  # strong references, so running tasks are not garbage collected
+
+def _prefetch_enabled() -> bool:
+    # Read per call: tmpfs_api.env is loaded by main after this module is imported
+    return os.getenv("OPENDATA_PREFETCH", "0").strip().lower() in ("1", "true", "yes")
+
 @tool(
     name_or_callable="list_catalog",
     description="Search the dataset catalog with a keyword."
@@ -55,11 +66,15 @@ async def list_catalog_tool(
     tool_call_id: Annotated[str, InjectedToolCallId],
 ) -> Command:
     res = await list_catalog(client=client, q=q, limit=15)
+    if _prefetch_enabled():
+        task = asyncio.create_task(prefetch_datasets(client, [r["dataset_id"] for r in res[:_PREFETCH_TOP_K]]))
+        _prefetch_tasks.add(task)
+        task.add_done_callback(_prefetch_tasks.discard)
     return Command(
         update={
             "messages": [
                 ToolMessage(
-                    content=json.dumps(res, ensure_ascii=False),
+                    content=orjson.dumps(res).decode(),
                     tool_call_id=tool_call_id,
                 )
             ]
@@ -67,6 +82,26 @@ async def list_catalog_tool(
     )
 
 
+@tool(
+    name_or_callable="describe_datasets",
+    description="Get the description and columns of one or more datasets (by dataset id) in a single call."
+)
+async def describe_datasets_tool(
+    dataset_ids: Annotated[List[str], "The dataset IDs to describe"],
+    tool_call_id: Annotated[str, InjectedToolCallId],
+) -> Command:
+    res = await describe_datasets(client=client, dataset_ids=dataset_ids)
+    return Command(
+        update={
+            "messages": [
+                ToolMessage(
+                    content=orjson.dumps(res).decode(),
+                    tool_call_id=tool_call_id,
+                )
+            ]
+        }
+    )
+
 
 # Create single session manager instance
 session_manager = SessionManager(
@@ -13,22 +13,26 @@ os.environ["BLOBSTORE_DIR"] = str(Path("tmpfs_api_blobstore").resolve())
 
 from langgraph.checkpoint.memory import InMemorySaver
 from dotenv import load_dotenv
+import asyncio
+import traceback
 import uuid
 
-from fastapi import FastAPI
+try:
+    import uvloop  # faster event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
 from langgraph_sandbox.artifacts.store import ensure_artifact_store
-from langgraph_sandbox.artifacts.api import router as artifacts_router
+from langgraph_sandbox.artifacts.server import start_artifact_server
 
 from langgraph_sandbox.config import Config
 from ex3_graph.tmpfs_api_ex_graph import get_builder
-from ex3_graph.tools import set_session_id, client
+from ex3_graph.tools import set_session_id, client, session_manager
 from langgraph_sandbox.sandbox.container_utils import cleanup_sandbox_containers
 from langgraph_sandbox.artifacts.reader import fetch_artifact_urls
 
 if __name__ == "__main__":
 
-    app = FastAPI()
-
     env = load_dotenv("tmpfs_api.env")
     if env == True: 
         print("Loaded .env file")
@@ -41,6 +45,9 @@ if __name__ == "__main__":
     
     # Clean up any existing sandbox containers to avoid conflicts
     cleanup_sandbox_containers()
+
+    # Start the sandbox container in the background while the user types
+    session_manager.prewarm(cfg.sandbox_prewarm)
     
     # Generate a unique session ID for this conversation
     convo_id = str(uuid.uuid4())[:8]
@@ -48,24 +55,10 @@ if __name__ == "__main__":
     
     # Set the session ID for the code execution tool
     set_session_id(convo_id)
-    
-    app.include_router(artifacts_router) # register endpoints
 
-    # Start the FastAPI server for artifacts
-    import uvicorn
-    import threading
-    import time
-    
-    def run_server():
-        try:
-            uvicorn.run(app, host="0.0.0.0", port=8000, log_level="error")
-        except Exception as e:
-            print(f"Server error: {e}")
-    
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
-    time.sleep(2)  # Give the server time to start
-    print("Artifact server started on http://localhost:8000")
+    # Start the FastAPI server for artifacts (the shared launcher builds the app)
+    server_port = start_artifact_server()
+    print(f"Artifact server started on http://localhost:{server_port}")
 
     builder = get_builder()
 
@@ -78,6 +71,10 @@ if __name__ == "__main__":
 
     usr_msg = ""
 
+    # One event loop for the whole conversation (uvloop if installed): async
+    # clients and connection pools created while streaming stay usable across turns
+    runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+
     while True:
 
         usr_msg = input("User: ")
@@ -86,15 +83,8 @@ if __name__ == "__main__":
             # Close the API client gracefully
             print("Closing API client...")
             try:
-                import asyncio
-                # Check if there's a running event loop
-                try:
-                    loop = asyncio.get_running_loop()
-                    # If we're in a running loop, schedule the close
-                    loop.create_task(client.close())
-                except RuntimeError:
-                    # No event loop running, create a new one
-                    asyncio.run(client.close())
+                # Close it on the loop its connections were opened on
+                runner.run(client.close())
             except Exception as e:
                 print(f"Warning: Could not close client gracefully: {e}")
             break
@@ -103,28 +93,23 @@ if __name__ == "__main__":
         
         try:
             # Use streaming to see real-time output and errors
-            import asyncio
-            
             async def run_stream():
                 async for chunk in graph.astream(
                     {"messages": [{"role": "user", "content": usr_msg}]},
                     {"configurable": {"thread_id": f"{convo_id}"}, "recursion_limit": 25},
                 ):
                     print(f"AI: {chunk['chat_model']['messages'][-1].content}")
-                    
-                    # Check if this is the final result
-                    if "messages" in chunk and chunk["messages"]:
-                        last_message = chunk["messages"][-1]
-                        if hasattr(last_message, 'content') and last_message.content:
-                            print(f"\nAI: {last_message.content}")
             
-            asyncio.run(run_stream())
+            runner.run(run_stream())
                         
         except Exception as e:
             print(f"\nERROR: {e}")
-            import traceback
             traceback.print_exc()
         
         # Artifacts are displayed directly in the agent's response
         
         print("\n" + "="*50 + "\n")
+
+    runner.close()
+    # Remove pre-started containers no session adopted
+    session_manager.shutdown_prewarmed()
@@ -1,6 +1,12 @@
 # bologna_opendata.py
+import asyncio
 import httpx
-from typing import Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any, Union
+
+try:
+    import h2  # optional (pip install "httpx[http2]"): lets httpx speak HTTP/2
+except ImportError:
+    h2 = None
 
 BASE_URL = "https://opendata.comune.bologna.it/api/explore/v2.1"
 
@@ -11,8 +17,18 @@ class BolognaOpenData:
 
         Args:
             timeout: request timeout in seconds (default 20.0).
+
+        One client (and connection pool) is shared by all tools, so repeated
+        catalog/export calls reuse kept-alive connections instead of paying a
+        new TLS handshake each time; the pool is bounded, and multiplexed over
+        HTTP/2 when h2 is installed.
         """
-        self._client = httpx.AsyncClient(base_url=BASE_URL, timeout=timeout)
+        self._client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            http2=h2 is not None,
+        )
         self._closed = False
 
     async def close(self):
@@ -87,6 +103,24 @@ class BolognaOpenData:
         r.raise_for_status()
         return r.json()
 
+    async def get_many(self, dataset_ids: Iterable[str]) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Get metadata for several datasets at once.
+
+        The requests run concurrently (multiplexed on one connection with
+        HTTP/2), so N datasets cost about one round-trip instead of N.
+        A failing id does not fail the batch: its slot holds the exception.
+
+        Args:
+            dataset_ids: the dataset id strings.
+
+        Returns:
+            One metadata dict (see get_dataset) or exception per id, in the same order.
+        """
+        return list(await asyncio.gather(
+            *(self.get_dataset(ds_id) for ds_id in dataset_ids), return_exceptions=True
+        ))
+
     async def query_records(
         self,
         dataset_id: str,
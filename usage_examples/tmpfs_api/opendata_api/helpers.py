@@ -1,7 +1,120 @@
-from .client import BolognaOpenData
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, Optional
+from collections import OrderedDict
+import asyncio, time
 import re, html
-from pathlib import Path
+
+if TYPE_CHECKING:
+    from .client import BolognaOpenData  # annotations only: callers pass the client in
+
+# --------------
+# response cache
+# --------------
+_MISS = object()
+
+
+class _TTLCache:
+    """
+    Small in-memory LRU cache whose entries expire after `ttl` seconds.
+
+    Concurrent misses on the same key are de-duplicated (single flight): the
+    first caller fetches, the others wait for it and reuse its result.
+    Failed fetches are not cached.
+
+    With `maxbytes`, values must be bytes and the cache is also bounded by
+    their total size; a value larger than `maxbytes` is returned uncached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, maxbytes: Optional[int] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()  # key -> (expires_at, value)
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _size(self, value: Any) -> int:
+        return len(value) if self.maxbytes is not None else 0
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= self._size(entry[1])
+
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISS
+        if entry[0] < time.monotonic():
+            self._discard(key)
+            return _MISS
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        size = self._size(value)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._bytes += size
+        while len(self._data) > self.maxsize or (self.maxbytes is not None and self._bytes > self.maxbytes):
+            evicted, (_, evicted_value) = self._data.popitem(last=False)
+            self._bytes -= self._size(evicted_value)
+            lock = self._locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted]
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = self._lookup(key)
+        if value is _MISS:
+            async with self._locks.setdefault(key, asyncio.Lock()):
+                # Another caller may have filled the entry while we waited
+                value = self._lookup(key)
+                if value is _MISS:
+                    self.misses += 1
+                    value = await fetch()
+                    self._store(key, value)
+                    return value
+        self.hits += 1
+        return value
+
+    async def take(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Remove and return the value for `key`, joining its fetch if one is in
+        flight. Without an entry, `fetch` is called and its result not cached.
+        """
+        lock = self._locks.get(key)
+        if (lock is None or not lock.locked()) and self._lookup(key) is _MISS:
+            return await fetch()
+        value = await self.get_or_fetch(key, fetch)
+        self._discard(key)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "bytes": self._bytes}
+
+
+# The agent often repeats the same search or dataset while reasoning:
+# keep recent answers instead of going back to the portal every time.
+# Parquet exports can be large, so fewer of them are kept, within a byte budget.
+_catalog_cache = _TTLCache(maxsize=64, ttl=300)
+_dataset_cache = _TTLCache(maxsize=8, ttl=600, maxbytes=64 * 1024 * 1024)
+# Speculative downloads (prefetch_datasets) live apart from the datasets the
+# agent actually selected, so they can never evict them
+_prefetch_cache = _TTLCache(maxsize=1, ttl=300, maxbytes=32 * 1024 * 1024)
+
+
+def stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counters and sizes of the catalog, dataset and prefetch caches."""
+    return {
+        "catalog": _catalog_cache.stats(),
+        "datasets": _dataset_cache.stats(),
+        "prefetch": _prefetch_cache.stats(),
+    }
+
 
 # --------------
 # list datasets
@@ -19,9 +132,13 @@ async def list_catalog(
     Args:
         q: optional free-text search.
         limit: number of datasets to return (API max ~100).
+
+    Results are cached for 5 minutes per (q, limit).
     """
 
-    catalog = await client.list_datasets(q=q, limit=limit)
+    catalog = await _catalog_cache.get_or_fetch(
+        (q, limit), lambda: client.list_datasets(q=q, limit=limit)
+    )
 
     out: List[Dict[str, str]] = []
     for item in catalog.get("results", []):
@@ -33,16 +150,84 @@ async def list_catalog(
     return out
 
 
+# ----------------
+# describe datasets
+# ----------------
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+async def describe_datasets(
+    client: BolognaOpenData,
+    dataset_ids: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Describe several datasets with one batch of concurrent requests.
+
+    Returns a list of dicts: {'dataset_id': str, 'title': str,
+    'description': str, 'fields': [{'name': str, 'type': str, 'label': str}]},
+    or {'dataset_id': str, 'error': str} for ids that could not be fetched.
+
+    Args:
+        dataset_ids: the dataset ids to describe (e.g. from list_catalog).
+    """
+    ids = list(dict.fromkeys(dataset_ids))
+    results = await client.get_many(ids)
+
+    out: List[Dict[str, Any]] = []
+    for dsid, item in zip(ids, results):
+        if isinstance(item, BaseException):
+            # Unknown id or request failure: report it, keep the other datasets
+            out.append({"dataset_id": dsid, "error": str(item) or type(item).__name__})
+            continue
+        metas = item.get("metas", {})
+        default_meta = metas.get("default", {}) if isinstance(metas.get("default", {}), dict) else {}
+        # Descriptions are HTML on the portal: keep plain text only
+        description = html.unescape(_TAG_RE.sub(" ", default_meta.get("description", "") or ""))
+        out.append({
+            "dataset_id": item.get("dataset_id", dsid),
+            "title": default_meta.get("title", "") or "",
+            "description": " ".join(description.split()),
+            "fields": [
+                {"name": f.get("name", ""), "type": f.get("type", ""), "label": f.get("label", "") or ""}
+                for f in item.get("fields", [])
+            ],
+        })
+    return out
+
+
 # ----------------
 # export dataset as parquet
 # ----------------
 async def get_dataset_bytes(client: BolognaOpenData, dataset_id: str) -> bytes:
     try:
-        # Export dataset as parquet bytes
-        parquet_bytes = await client.export(dataset_id, "parquet")
+        # Export dataset as parquet bytes (cached for 10 minutes per dataset);
+        # a prefetched copy (done or in flight) is moved over instead of downloading again
+        parquet_bytes = await _dataset_cache.get_or_fetch(
+            dataset_id,
+            lambda: _prefetch_cache.take(dataset_id, lambda: client.export(dataset_id, "parquet")),
+        )
     
         return parquet_bytes
         
     except Exception as e:
         print(f"Error exporting dataset: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+async def prefetch_datasets(client: BolognaOpenData, dataset_ids: List[str]) -> None:
+    """
+    Download exports into the prefetch cache ahead of time, so that a later
+    get_dataset_bytes for one of them is served from memory (or joins the
+    download already in flight). Speculative: failures are ignored, datasets
+    already cached are skipped, and prefetched entries never evict selected
+    ones.
+    """
+    async def prefetch_one(dataset_id: str) -> None:
+        if _dataset_cache._lookup(dataset_id) is not _MISS:
+            return
+        try:
+            await _prefetch_cache.get_or_fetch(dataset_id, lambda: client.export(dataset_id, "parquet"))
+        except Exception:
+            pass
+
+    await asyncio.gather(*(prefetch_one(dataset_id) for dataset_id in dict.fromkeys(dataset_ids)))